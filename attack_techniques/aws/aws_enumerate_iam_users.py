@@ -28,25 +28,22 @@ class AWSEnumerateIAMUsers(BaseTechnique):
             # Initialize boto3 client
             my_client = boto3.client("iam")
 
+            # Paginate so accounts with more than 100 users are fully enumerated
+            paginator = my_client.get_paginator("list_users")
+
             if path_prefix in [None,""]:
-                # list all iam roles
-                raw_response = my_client.list_users()
+                # list all iam users
+                page_iter = paginator.paginate(PaginationConfig={'PageSize': 1000})
             else:
-                # list roles with supplied path prefix
-                raw_response = my_client.list_users(PathPrefix=path_prefix)
+                # list users with supplied path prefix
+                page_iter = paginator.paginate(PathPrefix=path_prefix, PaginationConfig={'PageSize': 1000})
 
-            if 200 <= raw_response['ResponseMetadata']['HTTPStatusCode'] <300:
-                # Create output
-                users = [user['UserName'] for user in raw_response['Users']]
+            # Create output
+            users = [user['UserName'] for page in page_iter for user in page['Users']]
 
-                return ExecutionStatus.SUCCESS, {
-                    "message": f"Successfully enumerated {len(users)} users" if users else "No users found",
-                    "value": users
-                }
-            
-            return ExecutionStatus.FAILURE, {
-                "error": raw_response.get('ResponseMetadata', 'N/A'),
-                "message": "Failed to enumerate IAM users"
+            return ExecutionStatus.SUCCESS, {
+                "message": f"Successfully enumerated {len(users)} users" if users else "No users found",
+                "value": users
             }
         
         except ClientError as e:
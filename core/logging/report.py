@@ -2,12 +2,18 @@ import json
 from collections import Counter, defaultdict
 from datetime import datetime
 
+# Separator between log prefix and event json in technique execution log lines
+LOG_EXECUTION_MARKER = " - INFO - Technique Execution "
+
 def parse_log_entry(line):
     """Function to parse a line of log"""
+    # Skip other log lines with a substring check instead of a failed split and exception
+    _, marker, log_data = line.partition(LOG_EXECUTION_MARKER)
+    if not marker:
+        return None
     try:
-        _, log_data = line.split(" - INFO - Technique Execution ")
         return json.loads(log_data)
-    except:
+    except ValueError:
         return None
 
 def read_log_file(file_path):
@@ -16,7 +22,7 @@ def read_log_file(file_path):
         return file.readlines()
 
 def analyze_log(log_lines):
-    """Function to analyze app logs to generate metrics"""
+    """Function to analyze app logs to generate metrics. Accepts any iterable of log lines such as an open log file"""
     executions = defaultdict(dict)
     for line in log_lines:
         entry = parse_log_entry(line)
@@ -24,18 +30,17 @@ def analyze_log(log_lines):
             event_id = entry['event_id']
             executions[event_id].update(entry)
 
-    completed_executions = [ex for ex in executions.values() if 'result' in ex]
+    total_techniques = 0
+    successful_techniques = 0
+    failed_techniques = 0
 
-    total_techniques = len(completed_executions)
-    successful_techniques = sum(1 for ex in completed_executions if ex['result'] == 'success')
-    failed_techniques = sum(1 for ex in completed_executions if ex['result'] == 'failed')
+    technique_counts = Counter()
+    tactic_counts = Counter()
+    source_counts = Counter()
 
-    technique_counts = Counter(ex['technique'] for ex in completed_executions)
-    tactic_counts = Counter(ex['tactic'] for ex in completed_executions)
-    source_counts = Counter(ex['source'] for ex in completed_executions)
-
-    start_time = min(datetime.fromisoformat(ex['timestamp']) for ex in executions.values())
-    end_time = max(datetime.fromisoformat(ex['timestamp']) for ex in executions.values())
+    timestamps = [datetime.fromisoformat(ex['timestamp']) for ex in executions.values()]
+    start_time = min(timestamps)
+    end_time = max(timestamps)
     duration = end_time - start_time
 
     # Per-source analysis
@@ -49,8 +54,16 @@ def analyze_log(log_lines):
         'unique_techniques': 0,
     })
 
-    for ex in completed_executions:
+    # Update overall and per-source metrics in a single pass over completed executions
+    for ex in executions.values():
+        if 'result' not in ex:
+            continue
         source = ex['source']
+        total_techniques += 1
+        technique_counts[ex['technique']] += 1
+        tactic_counts[ex['tactic']] += 1
+        source_counts[source] += 1
+
         per_source_analysis[source]['total'] += 1
         per_source_analysis[source]['techniques'][ex['technique']].append({
             'execution_time': ex['timestamp'],
@@ -60,8 +73,11 @@ def analyze_log(log_lines):
         per_source_analysis[source]['tactics'][ex['tactic']] += 1
         
         if ex['result'] == 'success':
+            successful_techniques += 1
             per_source_analysis[source]['successful'] += 1
         else:
+            if ex['result'] == 'failed':
+                failed_techniques += 1
             per_source_analysis[source]['failed'] += 1
 
     for source, data in per_source_analysis.items():
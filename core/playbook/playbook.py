@@ -14,17 +14,39 @@ from core.playbook.playbook_error import PlaybookError
 from core.playbook.playbook_step import PlaybookStep
 from attack_techniques.technique_registry import TechniqueRegistry
 
+try:
+    # libyaml C loader, when PyYAML is built with it
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+# Parsed playbook data keyed on file path, stored with the file mtime it was parsed at
+_playbook_data_cache = {}
+
+def _load_playbook_data(pb_config_file: str) -> Dict[str, Any]:
+    """Load playbook YAML, reusing the parsed data while the file is unchanged"""
+    mtime = os.stat(pb_config_file).st_mtime_ns
+    cached = _playbook_data_cache.get(pb_config_file)
+    if cached is None or cached[0] != mtime:
+        with open(pb_config_file, "r") as pb_config_data:
+            cached = (mtime, yaml.load(pb_config_data, Loader=_YamlLoader))
+        _playbook_data_cache[pb_config_file] = cached
+    # Each instance gets its own copy as playbooks are edited in place
+    return copy.deepcopy(cached[1])
+
 class Playbook:
     """Creates, modifies, executes and manages Halberd playbook"""
     REQUIRED_FIELDS = ['PB_Name', 'PB_Author', 'PB_Creation_Date', 'PB_Description', 'PB_Sequence']
+    # Max description length shown in playbook list
+    SHORT_DESCRIPTION_LENGTH = 100
+    __slots__ = ('yaml_file', 'yaml_file_path', 'data', 'steps', 'min_exec_time_req', '_status')
 
     def __init__(self, pb_file_name: str):
         self.yaml_file = pb_file_name
         self.yaml_file_path = AUTOMATOR_PLAYBOOKS_DIR + "/" + pb_file_name
 
         pb_config_file = AUTOMATOR_PLAYBOOKS_DIR + "/" + pb_file_name
-        with open(pb_config_file, "r") as pb_config_data:
-            self.data = yaml.safe_load(pb_config_data)
+        self.data = _load_playbook_data(pb_config_file)
         
         # Total number of steps in playbook
         self.steps = len(self.data['PB_Sequence'])
@@ -110,7 +132,7 @@ class Playbook:
             
             # Parse the YAML content
             try:
-                playbook_data = yaml.safe_load(yaml_content)
+                playbook_data = yaml.load(yaml_content, Loader=_YamlLoader)
             except yaml.YAMLError as e:
                 raise PlaybookError(f"Error parsing YAML content: {str(e)}", error_type="invalid_data", error_operation="pb_import")
             
@@ -217,7 +239,7 @@ class Playbook:
     def add_step(self, new_step: PlaybookStep, step_no: Optional[int] = None) -> None:
         step_dict = {
             'Module': new_step.module,
-            'Params': new_step.params,
+            'Params': new_step.params or {},
             'Wait': new_step.wait if new_step.wait else 0
         }
 
@@ -299,7 +321,7 @@ class Playbook:
         t_id = step.module
     
         # Technique input
-        step_input = step.params
+        step_input = step.params_or_empty
 
         # Execute technique
         technique = TechniqueRegistry.get_technique(t_id)
@@ -432,6 +454,13 @@ class Playbook:
     @property
     def description(self) -> str:
         return self.data['PB_Description']
+
+    @property
+    def short_description(self) -> str:
+        description = self.data['PB_Description']
+        if len(description) > self.SHORT_DESCRIPTION_LENGTH:
+            return description[:self.SHORT_DESCRIPTION_LENGTH] + "..."
+        return description
     
     @property
     def references(self) -> List[str]:
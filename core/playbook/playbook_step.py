@@ -1,9 +1,19 @@
 from core.Constants import *
-from typing import List, Any, Optional
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Dict, Any, Optional, Mapping
 
+# Shared read-only params for steps without params
+_EMPTY_PARAMS = MappingProxyType({})
+
+@dataclass(slots=True)
 class PlaybookStep:
     """Defines a step in the playbook"""
-    def __init__(self, module: str, params: Optional[List[Any]], wait: Optional[int]):
-        self.module = module
-        self.params = params if params is not None else {}
-        self.wait = wait
\ No newline at end of file
+    module: str
+    params: Optional[Dict[str, Any]] = None
+    wait: Optional[int] = None
+
+    @property
+    def params_or_empty(self) -> Mapping[str, Any]:
+        """Step params, or a shared empty mapping if the step has no params"""
+        return self.params or _EMPTY_PARAMS
\ No newline at end of file
@@ -1,12 +1,20 @@
 """
 Credential providers module.
+
+Providers are imported on first access so that importing the package does
+not pull in every cloud SDK.
 """
 
-from .base_provider import BaseCredentialProvider
-from .entra_provider import EntraCredentialProvider
-from .aws_provider import AWSCredentialProvider
-from .gcp_provider import GCPCredentialProvider
-from .azure_provider import AzureCredentialProvider
+import importlib
+
+# Maps exported provider class to the submodule defining it
+_LAZY_PROVIDERS = {
+    'BaseCredentialProvider': 'base_provider',
+    'EntraCredentialProvider': 'entra_provider',
+    'AWSCredentialProvider': 'aws_provider',
+    'GCPCredentialProvider': 'gcp_provider',
+    'AzureCredentialProvider': 'azure_provider'
+}
 
 __all__ = [
     'BaseCredentialProvider',
@@ -14,4 +22,18 @@ __all__ = [
     'AWSCredentialProvider',
     'GCPCredentialProvider',
     'AzureCredentialProvider'
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    """Import provider class on first access and cache it on the package."""
+    if name in _LAZY_PROVIDERS:
+        module = importlib.import_module(f".{_LAZY_PROVIDERS[name]}", __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
\ No newline at end of file
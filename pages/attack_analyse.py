@@ -3,54 +3,249 @@ Page Navigation url : app/attack-analyse
 Page Description : Analyse Halberd attack executions.
 '''
 
+import os
+import re
+import mmap
+import time
+import threading
+from functools import lru_cache
 import json
+import numpy as np
 import pandas as pd
+from pandas.api.types import union_categoricals
+import pyarrow as pa
+import pyarrow.parquet as pq
 import plotly.express as px
 import plotly.graph_objects as go
 from datetime import timedelta
 
 from dash import dcc, html, register_page, callback
-from dash.dependencies import Input, Output
+from dash.dependencies import Input, Output, State
 from dash.exceptions import PreventUpdate
 import dash_bootstrap_components as dbc
 from dash_iconify import DashIconify
 
 from core.Constants import APP_LOG_FILE, REPORT_DIR
-from core.logging.report import read_log_file, analyze_log, generate_html_report
+
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+from core.logging.report import analyze_log, generate_html_report
 
 # Register page to app
 register_page(__name__, path='/attack-analyse', name='Analyze')
 
+# Separator between log prefix and event json in technique execution log lines
+LOG_EXECUTION_MARKER = b' - INFO - Technique Execution '
+# Logging asctime format of log line prefix
+LOG_TIMESTAMP_FORMAT = '%Y-%m-%d %H:%M:%S,%f'
+LOG_EXECUTION_LINE_RE = re.compile(rb'^([^\n]*?)' + re.escape(LOG_EXECUTION_MARKER) + rb'([^\n]*)\n', re.MULTILINE)
+
+# Event columns stored as categoricals
+CATEGORY_COLUMNS = ['technique', 'tactic', 'result', 'source', 'status']
+
+# File name of downloaded and saved HTML report
+REPORT_FILE_NAME = 'halberd_security_report.html'
+
+# Columnar cache of parsed events, kept next to app log file so dashboard startup skips text parsing
+LOG_CACHE_FILE = APP_LOG_FILE + '.parquet'
+# Schema metadata key storing the log file position covered by the cache
+LOG_CACHE_STATE_KEY = b'halberd_log_state'
+
+# Attack surfaces identified by technique name prefix
+ATTACK_SURFACES = ['AWS', 'Azure', 'Entra', 'M365']
+ATTACK_SURFACE_RE = re.compile('^(' + '|'.join(ATTACK_SURFACES) + ')')
+
+# Number of most executed techniques and most active sources shown in bar charts
+MAX_TECHNIQUES_SHOWN = 10
+MAX_SOURCES_SHOWN = 20
+
+# Parsed state of app log file. The log is append only, so only newly appended bytes are parsed on refresh
+_LOG_STATE = {'inode': None, 'offset': 0, 'df': pd.DataFrame(), 'version': 0, 'error': None, 'cache_version': 0}
+_LOG_STATE_LOCK = threading.Lock()
+# Set once the first background parse of app log has finished
+_LOG_READY = threading.Event()
+# Seconds between background checks for new log lines
+LOG_REFRESH_INTERVAL = 2
+# Minimum seconds between rewrites of parsed events cache file
+LOG_CACHE_SAVE_INTERVAL = 30
+
+def _parse_attack_log(start_offset=0):
+    """Parse technique execution events from app log file starting at byte offset.
+    Returns parsed dataframe and offset after the last complete line"""
+    timestamps = []
+    payloads = []
+
+    # Map log file instead of reading it into memory. Only lines with the marker are copied out
+    with open(APP_LOG_FILE, 'rb') as file:
+        if os.fstat(file.fileno()).st_size <= start_offset:
+            return pd.DataFrame(), start_offset
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as log_map:
+            # Stop after the last complete line. A trailing partial line is still being written and is left for next refresh
+            end_offset = log_map.rfind(b'\n', start_offset) + 1 or start_offset
+            # Scan only execution lines in one regex pass instead of splitting every log line in python
+            for match in LOG_EXECUTION_LINE_RE.finditer(log_map, start_offset, end_offset):
+                # Get timestamp from log prefix and event json from remainder of the line
+                timestamps.append(match.group(1).split(b' - ', 1)[0].decode('utf-8', errors='replace'))
+                payloads.append(match.group(2))
+
+    events = pd.Series(payloads, dtype=object).map(_parse_event)
+    valid = events.notna()
+    if not valid.any():
+        return pd.DataFrame(), end_offset
+
+    # Parse timestamps in one pass to reuse repeated values
+    timestamps = pd.to_datetime(pd.Series(timestamps)[valid], format=LOG_TIMESTAMP_FORMAT, errors='coerce', cache=True)
+
+    # Only keep event fields used by the dashboard
+    df = pd.DataFrame(events[valid].tolist(), columns=CATEGORY_COLUMNS)
+    df['timestamp'] = timestamps.values
+    return df[df['timestamp'].notna()].reset_index(drop=True), end_offset
+
+def _parse_event(data):
+    """Decode event json from a technique execution log line. Returns None if invalid"""
+    try:
+        event = json_loads(data)
+    except ValueError:
+        return None
+    return event if isinstance(event, dict) else None
+
+def _refresh_attack_log():
+    """Update parsed log state with new log lines. Returns version of parsed state"""
+    log_stat = os.stat(APP_LOG_FILE)
+    with _LOG_STATE_LOCK:
+        if _LOG_STATE['inode'] is None:
+            # First refresh. Resume from parsed events cache if it matches current log file
+            _load_log_cache(log_stat)
+
+        if log_stat.st_ino != _LOG_STATE['inode'] or log_stat.st_size < _LOG_STATE['offset']:
+            # Log file rotated or truncated. Parse from start
+            df, offset = _parse_attack_log()
+            _LOG_STATE.update(inode=log_stat.st_ino, offset=offset, df=_categorize_columns(_sort_by_timestamp(df)), version=_LOG_STATE['version'] + 1)
+        elif log_stat.st_size > _LOG_STATE['offset']:
+            new_df, offset = _parse_attack_log(_LOG_STATE['offset'])
+            # Offset only moves once new events are merged, so a failed merge parses the same lines again on next refresh
+            if len(new_df):
+                df = _sort_by_timestamp(_append_events(_LOG_STATE['df'], _categorize_columns(new_df)))
+                _LOG_STATE.update(offset=offset, df=df, version=_LOG_STATE['version'] + 1)
+            else:
+                _LOG_STATE['offset'] = offset
+
+        return _LOG_STATE['version']
+
+def _load_log_cache(log_stat):
+    """Load parsed events from cache file into log state if cache was built from current log file"""
+    try:
+        cache_state = json_loads(pq.read_schema(LOG_CACHE_FILE).metadata[LOG_CACHE_STATE_KEY])
+        if cache_state['inode'] != log_stat.st_ino or cache_state['offset'] > log_stat.st_size:
+            return
+        df = pq.read_table(LOG_CACHE_FILE).to_pandas()
+    except Exception:
+        # Missing, stale or unreadable cache. Log file will be parsed
+        return
+    version = _LOG_STATE['version'] + 1
+    _LOG_STATE.update(inode=cache_state['inode'], offset=cache_state['offset'], df=_categorize_columns(df), version=version, cache_version=version)
+
+def _save_log_cache():
+    """Write parsed events with the log position they cover to cache file if they changed since last write"""
+    # Take a snapshot so the file is written without blocking dashboard callbacks. Parsed frames are replaced, never modified
+    with _LOG_STATE_LOCK:
+        if _LOG_STATE['cache_version'] == _LOG_STATE['version']:
+            return
+        df, inode, offset, version = _LOG_STATE['df'], _LOG_STATE['inode'], _LOG_STATE['offset'], _LOG_STATE['version']
+    try:
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        cache_state = json.dumps({'inode': inode, 'offset': offset}).encode()
+        table = table.replace_schema_metadata({**(table.schema.metadata or {}), LOG_CACHE_STATE_KEY: cache_state})
+        # Replace cache in one step so a partially written file is never read
+        pq.write_table(table, LOG_CACHE_FILE + '.tmp', compression='zstd')
+        os.replace(LOG_CACHE_FILE + '.tmp', LOG_CACHE_FILE)
+    except Exception:
+        # Cache is optional. Log file is parsed on next startup
+        return
+    with _LOG_STATE_LOCK:
+        _LOG_STATE['cache_version'] = version
+
+def _sort_by_timestamp(df):
+    """Keep events ordered by timestamp so date ranges can be sliced with a binary search"""
+    if len(df) and not df['timestamp'].is_monotonic_increasing:
+        df = df.sort_values('timestamp', kind='stable', ignore_index=True)
+    return df
+
+def _append_events(df, new_df):
+    """Append categorized events to parsed events. Categories are merged so existing values are not encoded again"""
+    if not len(df):
+        return new_df
+    columns = {column: union_categoricals([_object_categories(df[column]), _object_categories(new_df[column])]) for column in CATEGORY_COLUMNS}
+    columns['timestamp'] = pd.concat([df['timestamp'], new_df['timestamp']], ignore_index=True)
+    return pd.DataFrame(columns)
+
+def _object_categories(series):
+    """Store categories as objects. A column with no values in a parsed batch has float categories, which cannot be merged with string categories"""
+    if series.cat.categories.dtype != object:
+        series = series.cat.set_categories(series.cat.categories.astype(object))
+    return series
+
+def _categorize_columns(df):
+    """Store low cardinality event columns as categoricals so counts run over integer codes"""
+    for column in CATEGORY_COLUMNS:
+        if column in df.columns and df[column].dtype != 'category':
+            df[column] = df[column].astype('category')
+    return df
+
+def _watch_attack_log():
+    """Keep parsed log state current in background so dashboard callbacks never wait on log parsing"""
+    last_cache_save = None
+    while True:
+        try:
+            _refresh_attack_log()
+            error = None
+        except Exception as e:
+            error = e
+        with _LOG_STATE_LOCK:
+            _LOG_STATE['error'] = error
+        _LOG_READY.set()
+        # Rewrite cache file at most once per save interval instead of on every refresh with new events
+        if last_cache_save is None or time.monotonic() - last_cache_save >= LOG_CACHE_SAVE_INTERVAL:
+            _save_log_cache()
+            last_cache_save = time.monotonic()
+        time.sleep(LOG_REFRESH_INTERVAL)
+
 def create_df_from_attack_logs():
-    # Read log file
-    with open(APP_LOG_FILE, 'r') as file:
-        log_data = file.read()
-    
-    events = []
-    for line in log_data.split('\n'):
-        if line.strip():
-            try:
-                parts = line.split(' - INFO - Technique Execution ', 1)
-                if len(parts) != 2:
-                    continue
-                    
-                timestamp = parts[0].split(' - ')[0]  # Get timestamp from first part
-                action = "Technique Execution"
-                data = parts[1]
-                
-                event = json.loads(data)
-                event['timestamp'] = pd.to_datetime(timestamp)
-                events.append(event)
-            except Exception as e:
-                continue
-    return pd.DataFrame(events)
+    """Returns parsed events from latest background refresh of app log"""
+    with _LOG_STATE_LOCK:
+        error, df = _LOG_STATE['error'], _LOG_STATE['df']
+    if error is not None:
+        raise error
+    return df
+
+def _value_counts(series):
+    """Value counts excluding categories not present in series"""
+    return _nonzero_counts(series.value_counts())
+
+def _nonzero_counts(counts):
+    """Counts of values present in events, most frequent first"""
+    return counts[counts > 0].sort_values(ascending=False, kind='stable')
+
+def _count_table(rows, columns):
+    """Event counts for each pair of values of two categorical columns, counted in one pass over category codes"""
+    row_codes = rows.cat.codes.to_numpy()
+    column_codes = columns.cat.codes.to_numpy()
+    # Skip events missing either value
+    present = (row_codes >= 0) & (column_codes >= 0)
+    n_rows, n_columns = len(rows.cat.categories), len(columns.cat.categories)
+    counts = np.bincount(row_codes[present].astype(np.int64) * n_columns + column_codes[present], minlength=n_rows * n_columns)
+    return pd.DataFrame(counts.reshape(n_rows, n_columns), index=rows.cat.categories.astype(object), columns=columns.cat.categories.astype(object))
 
 def process_attack_data(df, start_date=None, end_date=None):
     """
     Process attack data with optional date filtering
     """
     if start_date and end_date:
-        df = df[(df['timestamp'] >= start_date) & (df['timestamp'] <= end_date)]
+        # Events are sorted by timestamp. Slice date range instead of building a boolean mask
+        timestamps = df['timestamp']
+        df = df.iloc[timestamps.searchsorted(start_date, side='left'):timestamps.searchsorted(end_date, side='right')]
     
     # Get completed attacks only
     completed_attacks = df[df['status'] == 'completed']
@@ -74,27 +269,31 @@ def process_attack_data(df, start_date=None, end_date=None):
             'unique_techniques': 0
         }
 
-    # Calculate metrics
-    status_counts = completed_attacks['result'].value_counts()
-    surface_counts = completed_attacks['technique'].apply(lambda x: 'AWS' if x.startswith('AWS') else 
-                                                        'Azure' if x.startswith('Azure') else
-                                                        'Entra' if x.startswith('Entra') else
-                                                        'M365' if x.startswith('M365') else 'Other').value_counts()
-    tactic_counts = completed_attacks['tactic'].value_counts()
-    technique_counts = completed_attacks['technique'].value_counts().head(10)
-    source_counts = completed_attacks['source'].value_counts()
+    # Calculate metrics. Tactic, result and tactic success counts all come from one tactic by result count table
+    tactic_results = _count_table(completed_attacks['tactic'], completed_attacks['result'])
+    status_counts = _nonzero_counts(tactic_results.sum(axis=0))
+    tactic_counts = _nonzero_counts(tactic_results.sum(axis=1))
+    # Only the top techniques are shown, so select them instead of sorting all technique counts
+    technique_totals = completed_attacks['technique'].value_counts(sort=False)
+    technique_totals = technique_totals[technique_totals > 0]
+    technique_counts = technique_totals.nlargest(MAX_TECHNIQUES_SHOWN)
+
+    # Classify each distinct technique once and sum its counts by attack surface
+    surface = technique_totals.index.astype(str).str.extract(ATTACK_SURFACE_RE, expand=False).fillna('Other')
+    surface_counts = technique_totals.groupby(surface.values).sum().sort_values(ascending=False, kind='stable')
+    source_counts = _value_counts(completed_attacks['source']).head(MAX_SOURCES_SHOWN)
     
     # Tactic success rate
-    tactic_success = pd.crosstab(completed_attacks['tactic'], completed_attacks['result'])
+    tactic_success = tactic_results.loc[tactic_counts.index.sort_values(), status_counts.index.sort_values()]
     tactic_success['success_rate'] = (tactic_success['success'] / (tactic_success['success'] + tactic_success.get('failed', 0)) * 100).round(2)
     
     # Timeline data
-    timeline_data = completed_attacks.set_index('timestamp').resample('1h').size()
+    # Count events per hour without a timestamp indexed copy of events. Empty hours are kept as zero for the timeline
+    hours = completed_attacks['timestamp'].dt.floor('h')
+    timeline_data = hours.value_counts(sort=False).reindex(pd.date_range(hours.iloc[0], hours.iloc[-1], freq='h'), fill_value=0)
     
-    # Calculate time between attacks
-    sorted_attacks = completed_attacks.sort_values('timestamp')
-    attack_intervals = sorted_attacks['timestamp'].diff().dropna()
-    median_interval = attack_intervals.median()
+    # Calculate time between attacks. Events are already sorted by timestamp
+    median_interval = completed_attacks['timestamp'].diff().median()
 
     return {
         'status_counts': status_counts,
@@ -111,9 +310,58 @@ def process_attack_data(df, start_date=None, end_date=None):
         'timeline_data': timeline_data,
         'median_interval': median_interval,
         'total_executions': len(completed_attacks),
-        'unique_techniques': len(completed_attacks['technique'].unique())
+        'unique_techniques': len(technique_totals)
     }
 
+@lru_cache(maxsize=32)
+def _process_attack_data_cached(log_version, start_date, end_date):
+    return process_attack_data(_LOG_STATE['df'], start_date, end_date)
+
+def get_attack_data(start_date=None, end_date=None):
+    """Returns processed attack data for date range. Reuses results while no new events are logged"""
+    return _process_attack_data_cached(_LOG_STATE['version'], start_date, end_date)
+
+# Parse app log in background from page import
+threading.Thread(target=_watch_attack_log, name='attack-log-watcher', daemon=True).start()
+
+@lru_cache(maxsize=64)
+def _parse_date(date):
+    """Parse date picker value. Values repeat across interactions so parsed dates are reused"""
+    return pd.to_datetime(date)
+
+def _series_to_store(series):
+    """Convert count series to json serializable index and values lists"""
+    return {'index': series.index.tolist(), 'values': series.tolist()}
+
+def serialize_attack_data(data):
+    """Convert processed attack data to json serializable dict for attack data store"""
+    tactic_success = data['tactic_success'].get('success_rate', pd.Series(dtype='float64'))
+    median_interval = data.get('median_interval')
+    return {
+        'surface_counts': _series_to_store(data['surface_counts']),
+        'tactic_counts': _series_to_store(data['tactic_counts']),
+        'technique_counts': _series_to_store(data['technique_counts']),
+        'source_counts': _series_to_store(data['source_counts']),
+        'tactic_success': _series_to_store(tactic_success),
+        'timeline_data': {
+            'index': data['timeline_data'].index.astype(str).tolist(),
+            'values': data['timeline_data'].tolist()
+        },
+        'median_interval': f"{median_interval.total_seconds()/60:.1f}min" if pd.notna(median_interval) else "N/A",
+        'success_rate': f"{(data['status_counts'].get('success', 0) / data['total_executions'] * 100):.1f}%" if data['total_executions'] > 0 else "N/A",
+        'duration': str(data['testing_period']['duration']).split('.')[0],
+        'total_executions': data['total_executions'],
+        'unique_techniques': data['unique_techniques']
+    }
+
+@lru_cache(maxsize=32)
+def _serialize_attack_data_cached(log_version, start_date, end_date):
+    return serialize_attack_data(_process_attack_data_cached(log_version, start_date, end_date))
+
+def get_attack_store_data(start_date=None, end_date=None):
+    """Returns attack data store contents for date range with display strings formatted once per log version"""
+    return _serialize_attack_data_cached(_LOG_STATE['version'], start_date, end_date)
+
 THEME = {
     'background': '#1a1a1a',  # Main background
     'paper': '#2d2d2d',      # Card background
@@ -128,31 +376,41 @@ THEME = {
     'info': '#00bcd4'        # Info color
 }
 
-def create_dark_theme_template():
-    return {
-        'layout': {
-            'paper_bgcolor': "#1a1a1a",
-            'plot_bgcolor': "#1a1a1a",
-            'font': {'color': THEME['text']},
-            'xaxis': {
-                'gridcolor': THEME['border'],
-                'linecolor': THEME['border'],
-                'zerolinecolor': THEME['border']
-            },
-            'yaxis': {
-                'gridcolor': THEME['border'],
-                'linecolor': THEME['border'],
-                'zerolinecolor': THEME['border']
-            }
+# Dashboard card and row styles shared by layout and callbacks
+CARD_STYLE = {'padding': '20px', 'borderRadius': '10px', 'boxShadow': '0 2px 4px rgba(0,0,0,0.1)'}
+FULL_WIDTH_CARD_STYLE = {**CARD_STYLE, 'marginBottom': '20px'}
+LEFT_CARD_STYLE = {'width': '48%', **CARD_STYLE}
+RIGHT_CARD_STYLE = {'width': '48%', 'marginLeft': '4%', **CARD_STYLE}
+GRAPH_ROW_STYLE = {'display': 'flex', 'marginBottom': '20px'}
+METRIC_CARD_STYLE = {'width': '23%', 'marginRight': '2%'}
+LAST_METRIC_CARD_STYLE = {'width': '23%'}
+FOOTER_STYLE = {'textAlign': 'center', **CARD_STYLE}
+
+# Dark theme template shared by all dashboard figures. Built once since plotly only reads it
+DARK_THEME_TEMPLATE = {
+    'layout': {
+        'paper_bgcolor': "#1a1a1a",
+        'plot_bgcolor': "#1a1a1a",
+        'font': {'color': THEME['text']},
+        'xaxis': {
+            'gridcolor': THEME['border'],
+            'linecolor': THEME['border'],
+            'zerolinecolor': THEME['border']
+        },
+        'yaxis': {
+            'gridcolor': THEME['border'],
+            'linecolor': THEME['border'],
+            'zerolinecolor': THEME['border']
         }
     }
+}
 
 # Update the graph creation functions to use dark theme
-def create_timeline_graph(data):
+def create_timeline_graph(x, y):
     fig = go.Figure(data=[
         go.Scatter(
-            x=data['timeline_data'].index,
-            y=data['timeline_data'].values,
+            x=x,
+            y=y,
             fill='tozeroy',
             fillcolor=f'rgba(0, 255, 157, 0.1)',  # Halberd green with opacity
             line={'color': THEME['accent']},
@@ -161,7 +419,7 @@ def create_timeline_graph(data):
     ])
     
     fig.update_layout(
-        template=create_dark_theme_template(),
+        template=DARK_THEME_TEMPLATE,
         title='Attack Execution Timeline',
         xaxis_title='Time',
         yaxis_title='Number of Attacks',
@@ -179,7 +437,7 @@ def create_pie_chart(values, names, title):
     )
     
     fig.update_layout(
-        template=create_dark_theme_template(),
+        template=DARK_THEME_TEMPLATE,
         height=350
     )
     return fig
@@ -193,13 +451,22 @@ def create_bar_chart(x, y, title, orientation='v', color=THEME['accent']):
     )])
     
     fig.update_layout(
-        template=create_dark_theme_template(),
+        template=DARK_THEME_TEMPLATE,
         title=title,
         xaxis_tickangle=-45 if orientation == 'v' else 0,
         height=400
     )
     return fig
 
+@lru_cache(maxsize=64)
+def _create_figure_json(create_figure, *args, **kwargs):
+    return create_figure(*args, **kwargs).to_json()
+
+def create_cached_figure(create_figure, *args, **kwargs):
+    """Returns figure dict for graph. Figures are built once per chart data and served from serialized cache after"""
+    args = tuple(tuple(arg) if isinstance(arg, list) else arg for arg in args)
+    return json_loads(_create_figure_json(create_figure, *args, **kwargs))
+
 def create_metric_card(title, value, icon, color):
     return html.Div([
         html.Div([
@@ -398,7 +665,63 @@ def create_welcome_layout() -> html.Div:
         'padding': '40px 20px'
     })
 
+def create_loading_layout() -> html.Div:
+    """Creates a loading layout shown until the app log has been parsed"""
+    return html.Div(
+        html.Div([
+            dbc.Spinner(color="danger", spinner_style={'width': '48px', 'height': '48px'}),
+            html.P('Loading attack executions...',
+                   style={'color': THEME['secondary_text'], 'fontSize': '18px', 'marginTop': '20px'}),
+            dcc.Interval(id='attack-analyse-loading-interval', interval=1000)
+        ], style={
+            'backgroundColor': THEME['background'],
+            'minHeight': '100vh',
+            'padding': '40px 20px',
+            'textAlign': 'center'
+        }),
+        id='attack-analyse-loading'
+    )
+
+def create_graph_placeholder(graph_id):
+    """Placeholder filled by the graph's own callback, so each graph renders as soon as it is ready"""
+    return dcc.Loading(html.Div(id=graph_id), type='default')
+
+def create_graph_card(graph_id, style):
+    """Card wrapping a graph placeholder"""
+    return html.Div([create_graph_placeholder(graph_id)], style=style)
+
+def create_graphs_container() -> html.Div:
+    """Creates dashboard graphs layout with a placeholder for each graph"""
+    return html.Div([
+        # Timeline Graph
+        html.Div([
+            create_graph_placeholder('timeline-graph')
+        ], style=FULL_WIDTH_CARD_STYLE, className="bg-halberd-dark"),
+        
+        # Surface Distribution and Success Rate Row
+        html.Div([
+            create_graph_card('surface-graph', LEFT_CARD_STYLE),
+            create_graph_card('tactic-success-graph', RIGHT_CARD_STYLE)
+        ], style=GRAPH_ROW_STYLE, className="bg-halberd-dark"),
+        
+        # MITRE Tactics and Source Distribution Row
+        html.Div([
+            create_graph_card('tactic-graph', LEFT_CARD_STYLE),
+            create_graph_card('source-graph', RIGHT_CARD_STYLE)
+        ], style=GRAPH_ROW_STYLE, className="bg-halberd-dark"),
+        
+        # Top Techniques Row
+        html.Div([
+            create_graph_placeholder('technique-graph')
+        ], style=FULL_WIDTH_CARD_STYLE, className="bg-halberd-dark")
+    ], id='graphs-container')
+
+# Graphs layout is static. Built once and reused by every page load
+GRAPHS_CONTAINER = create_graphs_container()
+
 def create_layout():
+    if not _LOG_READY.is_set():
+        return create_loading_layout()
     try:
         df = create_df_from_attack_logs()
         # Handle empty log file
@@ -452,7 +775,12 @@ def create_layout():
         ], style={'marginBottom': '20px'}),
         
         # Graphs Container - will be updated by callbacks
-        html.Div(id='graphs-container'),
+        GRAPHS_CONTAINER,
+
+        # Processed attack data for selected date range. Shared by dashboard callbacks
+        dcc.Store(id='attack-data-store'),
+        # Date range and log version of data in attack data store
+        dcc.Store(id='attack-data-store-key'),
         
         # Footer with execution statistics
         html.Div(id='footer-stats')
@@ -461,145 +789,178 @@ def create_layout():
 # Create attack analyse layout
 layout = create_layout
 
+'''Callback to replace loading layout once app log has been parsed'''
+@callback(
+    Output('attack-analyse-loading', 'children'),
+    Input('attack-analyse-loading-interval', 'n_intervals'),
+    prevent_initial_call=True
+)
+def update_loading_layout_callback(n_intervals):
+    if not _LOG_READY.is_set():
+        raise PreventUpdate
+    return create_layout()
+
+'''Callback to process attack data for selected date range'''
+@callback(
+    [Output('attack-data-store', 'data'),
+     Output('attack-data-store-key', 'data')],
+    [Input('date-picker-range', 'start_date'),
+     Input('date-picker-range', 'end_date')],
+    State('attack-data-store-key', 'data')
+)
+def update_attack_data_store_callback(start_date, end_date, store_key):
+    # Skip update if store already holds data for this date range and log state
+    key = [start_date, end_date, _LOG_STATE['version']]
+    if store_key == key:
+        raise PreventUpdate
+    return get_attack_store_data(_parse_date(start_date), _parse_date(end_date)), key
+
 '''Callback to update metrics card in analyse dashboard'''
 @callback(
     Output('metric-cards', 'children'),
-    [Input('date-picker-range', 'start_date'),
-     Input('date-picker-range', 'end_date')]
+    Input('attack-data-store', 'data'),
+    prevent_initial_call=True
 )
-def update_metric_cards_callback(start_date, end_date):
-    df = create_df_from_attack_logs()
-    data = process_attack_data(df, pd.to_datetime(start_date), pd.to_datetime(end_date))
-    
+def update_metric_cards_callback(data):
+
     return [
         html.Div([
             create_metric_card("Total Executions", data['total_executions'], "fa-flask", "#3498db"),
-        ], style={'width': '23%', 'marginRight': '2%'}),
+        ], style=METRIC_CARD_STYLE),
         html.Div([
             create_metric_card("Unique Techniques Executed", data['unique_techniques'], "fa-code-branch", "#2ecc71"),
-        ], style={'width': '23%', 'marginRight': '2%'}),
+        ], style=METRIC_CARD_STYLE),
         html.Div([
-            create_metric_card("Attack Success Rate", 
-                             f"{(data['status_counts'].get('success', 0) / data['total_executions'] * 100):.1f}%" if data['total_executions'] > 0 else "N/A", 
-                             "fa-check-circle", "#e74c3c"),
-        ], style={'width': '23%', 'marginRight': '2%'}),
+            create_metric_card("Attack Success Rate", data['success_rate'], "fa-check-circle", "#e74c3c"),
+        ], style=METRIC_CARD_STYLE),
         html.Div([
-            create_metric_card("Avg Interval", 
-                             f"{data['median_interval'].total_seconds()/60:.1f}min" if 'median_interval' in data else "N/A", 
-                             "fa-clock", "#9b59b6"),
-        ], style={'width': '23%'})
+            create_metric_card("Avg Interval", data['median_interval'], "fa-clock", "#9b59b6"),
+        ], style=LAST_METRIC_CARD_STYLE)
     ]
 
-'''Callback to update graphs container in analyse dashboard'''
+'''Callback to update attack timeline graph in analyse dashboard'''
 @callback(
-    Output('graphs-container', 'children'),
-    [Input('date-picker-range', 'start_date'),
-     Input('date-picker-range', 'end_date')]
+    Output('timeline-graph', 'children'),
+    Input('attack-data-store', 'data'),
+    prevent_initial_call=True
 )
-def update_graphs_callback(start_date, end_date):
-    df = create_df_from_attack_logs()
-    data = process_attack_data(df, pd.to_datetime(start_date), pd.to_datetime(end_date))
-    
-    return [
-        # Timeline Graph
-        html.Div([
-            dcc.Graph(
-                figure=create_timeline_graph(data),
-                className="halberd-depth-card"
-            )
-        ], 
-        style={
-            'padding': '20px', 
-            'borderRadius': '10px', 
-            'boxShadow': '0 2px 4px rgba(0,0,0,0.1)', 
-            'marginBottom': '20px'
-        }, 
-        className="bg-halberd-dark"),
-        
-        # Surface Distribution and Success Rate Row
-        html.Div([
-            html.Div([
-                dcc.Graph(
-                    figure=create_pie_chart(
-                        data['surface_counts'].values,
-                        data['surface_counts'].index,
-                        'Attack Surface Distribution',
-                    ),
-                    className="halberd-depth-card"
-                )
-            ], 
-            style={'width': '48%', 'padding': '20px', 'borderRadius': '10px', 'boxShadow': '0 2px 4px rgba(0,0,0,0.1)'},
-            ),
-            
-            html.Div([
-                dcc.Graph(
-                    figure=create_bar_chart(
-                        data['tactic_success'].index,
-                        data['tactic_success']['success_rate'],
-                        'Attack Success Rate by Tactic'
-                    ),
-                    className="halberd-depth-card"
-                )
-            ], style={'width': '48%', 'marginLeft': '4%', 'padding': '20px', 'borderRadius': '10px', 'boxShadow': '0 2px 4px rgba(0,0,0,0.1)'})
-        ], style={'display': 'flex', 'marginBottom': '20px'}, className="bg-halberd-dark"),
-        
-        # MITRE Tactics and Source Distribution Row
-        html.Div([
-            html.Div([
-                dcc.Graph(
-                    figure=create_bar_chart(
-                        data['tactic_counts'].index,
-                        data['tactic_counts'].values,
-                        'Attacks Executed by MITRE Tactics'
-                    ),
-                    className="halberd-depth-card"
-                )
-            ], style={'width': '48%', 'padding': '20px', 'borderRadius': '10px', 
-                      'boxShadow': '0 2px 4px rgba(0,0,0,0.1)'}),
-            
-            html.Div([
-                dcc.Graph(
-                    figure=create_bar_chart(
-                        data['source_counts'].index,
-                        data['source_counts'].values,
-                        'Attacks Executed by Source Entity'
-                    ),
-                    className="halberd-depth-card"
-                )
-            ], style={'width': '48%', 'marginLeft': '4%', 'padding': '20px', 'borderRadius': '10px', 'boxShadow': '0 2px 4px rgba(0,0,0,0.1)'})
-        ], style={'display': 'flex', 'marginBottom': '20px'}, className="bg-halberd-dark"),
-        
-        # Top Techniques Row
-        html.Div([
-            dcc.Graph(figure=create_bar_chart(
-                data['technique_counts'].values,
-                data['technique_counts'].index,
-                'Most Executed Techniques',
-                orientation='h'
-            )
-            )
-        ], style={'padding': '20px', 'borderRadius': '10px', 'boxShadow': '0 2px 4px rgba(0,0,0,0.1)', 'marginBottom': '20px'}, className="bg-halberd-dark")
-    ]
+def update_timeline_graph_callback(data):
+    return dcc.Graph(
+        figure=create_cached_figure(
+            create_timeline_graph,
+            data['timeline_data']['index'],
+            data['timeline_data']['values']
+        ),
+        className="halberd-depth-card"
+    )
+
+'''Callback to update attack surface graph in analyse dashboard'''
+@callback(
+    Output('surface-graph', 'children'),
+    Input('attack-data-store', 'data'),
+    prevent_initial_call=True
+)
+def update_surface_graph_callback(data):
+    return dcc.Graph(
+        figure=create_cached_figure(
+            create_pie_chart,
+            data['surface_counts']['values'],
+            data['surface_counts']['index'],
+            'Attack Surface Distribution',
+        ),
+        className="halberd-depth-card"
+    )
+
+'''Callback to update tactic success rate graph in analyse dashboard'''
+@callback(
+    Output('tactic-success-graph', 'children'),
+    Input('attack-data-store', 'data'),
+    prevent_initial_call=True
+)
+def update_tactic_success_graph_callback(data):
+    return dcc.Graph(
+        figure=create_cached_figure(
+            create_bar_chart,
+            data['tactic_success']['index'],
+            data['tactic_success']['values'],
+            'Attack Success Rate by Tactic'
+        ),
+        className="halberd-depth-card"
+    )
+
+'''Callback to update MITRE tactics graph in analyse dashboard'''
+@callback(
+    Output('tactic-graph', 'children'),
+    Input('attack-data-store', 'data'),
+    prevent_initial_call=True
+)
+def update_tactic_graph_callback(data):
+    return dcc.Graph(
+        figure=create_cached_figure(
+            create_bar_chart,
+            data['tactic_counts']['index'],
+            data['tactic_counts']['values'],
+            'Attacks Executed by MITRE Tactics'
+        ),
+        className="halberd-depth-card"
+    )
+
+'''Callback to update source entity graph in analyse dashboard'''
+@callback(
+    Output('source-graph', 'children'),
+    Input('attack-data-store', 'data'),
+    prevent_initial_call=True
+)
+def update_source_graph_callback(data):
+    return dcc.Graph(
+        figure=create_cached_figure(
+            create_bar_chart,
+            data['source_counts']['index'],
+            data['source_counts']['values'],
+            'Attacks Executed by Source Entity'
+        ),
+        className="halberd-depth-card"
+    )
+
+'''Callback to update top techniques graph in analyse dashboard'''
+@callback(
+    Output('technique-graph', 'children'),
+    Input('attack-data-store', 'data'),
+    prevent_initial_call=True
+)
+def update_technique_graph_callback(data):
+    return dcc.Graph(figure=create_cached_figure(
+        create_bar_chart,
+        data['technique_counts']['values'],
+        data['technique_counts']['index'],
+        'Most Executed Techniques',
+        orientation='h'
+    ))
 
 '''Callback to update footer stats in analyse dashboard'''
 @callback(
     Output('footer-stats', 'children'),
-    [Input('date-picker-range', 'start_date'),
-     Input('date-picker-range', 'end_date')]
+    Input('attack-data-store', 'data'),
+    prevent_initial_call=True
 )
-def update_footer_stats_callback(start_date, end_date):
-    df = create_df_from_attack_logs()
-    data = process_attack_data(df, pd.to_datetime(start_date), pd.to_datetime(end_date))
-    
+def update_footer_stats_callback(data):
     return html.Div([
         html.H3('Execution Statistics', style={'marginBottom': '15px'}),
         html.P([
-            f"Test Duration: {str(data['testing_period']['duration']).split('.')[0]} | ",
+            f"Test Duration: {data['duration']} | ",
             f"Total Attacks: {data['total_executions']} | ",
             f"Unique Techniques: {data['unique_techniques']} | ",
-            f"Average Success Rate: {(data['status_counts'].get('success', 0) / data['total_executions'] * 100):.1f}%" if data['total_executions'] > 0 else "N/A"
+            f"Average Success Rate: {data['success_rate']}" if data['total_executions'] > 0 else "N/A"
         ], style={'color': '#7f8c8d'})
-    ], style={'textAlign': 'center', 'padding': '20px', 'borderRadius': '10px', 'boxShadow': '0 2px 4px rgba(0,0,0,0.1)'}, className="bg-halberd-dark")
+    ], style=FOOTER_STYLE, className="bg-halberd-dark")
+
+def _save_report(html_report):
+    """Save a copy of generated report to report directory"""
+    try:
+        with open(f'{REPORT_DIR}/{REPORT_FILE_NAME}', 'w', encoding='utf-8') as report_file:
+            report_file.write(html_report)
+    except OSError:
+        pass
 
 '''Callback to generate analyze report'''
 @callback(
@@ -611,14 +972,14 @@ def generate_trace_report_callback(n_clicks):
     if n_clicks == 0:
         raise PreventUpdate
     try:
-        log_lines = read_log_file(APP_LOG_FILE)
-        analysis_results = analyze_log(log_lines)
+        # Stream log lines into analysis instead of reading whole log into a list
+        with open(APP_LOG_FILE, 'r', encoding='utf-8', buffering=8192) as log_file:
+            analysis_results = analyze_log(log_file)
         html_report = generate_html_report(analysis_results)
         
-        # Save the HTML report
-        with open(f'{REPORT_DIR}/halberd_security_report.html', 'w', encoding='utf-8') as report_file:
-            report_file.write(html_report)
-        return dcc.send_file(f'{REPORT_DIR}/halberd_security_report.html')
+        # Save a copy of the HTML report in background and send the report from memory
+        threading.Thread(target=_save_report, args=(html_report,), daemon=True).start()
+        return dcc.send_string(html_report, REPORT_FILE_NAME)
     except FileNotFoundError:
         return (f"Error: The file '{APP_LOG_FILE}' was not found. Ensure the log file exists and the path is correct.")
     except Exception:
@@ -4,12 +4,12 @@ Page Description : Manage (add/edit/schedule/import/export) and execute playbook
 '''
 
 import os
-import json
 import threading
 from datetime import date
+from functools import lru_cache
 
 import dash
-from dash import dcc, html, ALL, callback_context, no_update, MATCH, register_page, callback
+from dash import dcc, html, ALL, callback_context, no_update, MATCH, Patch, register_page, callback
 from dash.dependencies import Input, Output, State
 from dash.exceptions import PreventUpdate
 import dash_bootstrap_components as dbc
@@ -27,6 +27,24 @@ from core.Constants import AUTOMATOR_PLAYBOOKS_DIR, AUTOMATOR_OUTPUT_DIR
 # Register page to app
 register_page(__name__, path='/automator', name='Automator')
 
+# Number of playbook cards rendered per page of the playbook list
+PLAYBOOK_LIST_PAGE_SIZE = 25
+
+# Execution progress polling interval (ms). Polling backs off up to the max interval while no step completes
+EXECUTION_POLL_INTERVAL = 1000
+EXECUTION_POLL_MAX_INTERVAL = 4000
+
+# Playbook card styles, shared by every card instead of rebuilt per card
+PLAYBOOK_CARD_STYLE = {"backgroundColor": "#2d2d2d"}
+PLAYBOOK_CARD_CLICK_STYLE = {"position": "relative", "cursor": "pointer"}
+PLAYBOOK_DESCRIPTION_STYLE = {
+    "minHeight": "45px",
+    "maxHeight": "45px",
+    "overflow": "hidden",
+    "textOverflow": "ellipsis"
+}
+PLAYBOOK_ACTIONS_STYLE = {"zIndex": "1"}
+
 def create_playbook_manager_layout():
     """Creates the playbook management interface layout"""
     return html.Div([
@@ -125,7 +143,9 @@ def create_playbook_manager_layout():
                         'overflowY': 'auto',
                         'height':'76vh'
                     }
-                )
+                ),
+                # Number of playbook cards rendered in the list
+                dcc.Store(id='playbook-list-limit', data=PLAYBOOK_LIST_PAGE_SIZE)
             ], width=4, className="bg-halberd-dark"),
 
             # Right Panel - Playbook Visualization
@@ -180,7 +200,7 @@ def create_playbook_manager_layout():
         # Add stores and intervals for progress tracking
         dcc.Interval(
             id="execution-interval",
-            interval=1000,  # 1 second refresh
+            interval=EXECUTION_POLL_INTERVAL,
             disabled=True
         ),
         
@@ -189,6 +209,8 @@ def create_playbook_manager_layout():
         # Memory store to save selected playbook context
         dcc.Store(id='selected-playbook-data', data={}),
         dcc.Store(id='selected-playbook-data-editor-memory-store', data={}),
+        # Playbook file and mtime currently shown in the visualization panel
+        dcc.Store(id='playbook-visualization-key'),
         
         # Primary off canvas to support various workflows
         dbc.Offcanvas(
@@ -225,6 +247,18 @@ def create_playbook_item(playbook_config):
     Returns:
         dash.html.Div: A clickable playbook card component with actions
     """
+    return _build_playbook_item(
+        playbook_config.yaml_file,
+        playbook_config.name,
+        playbook_config.author,
+        playbook_config.creation_date,
+        playbook_config.short_description
+    )
+
+# Cards are cached on the playbook values they display, so an edited playbook gets a new card
+@lru_cache(maxsize=512)
+def _build_playbook_item(yaml_file, name, author, creation_date, short_description):
+    """Builds the playbook card component for create_playbook_item"""
     return html.Div([  # Wrapper div for click handling
         dbc.Card([
             dbc.CardBody([
@@ -242,7 +276,7 @@ def create_playbook_item(playbook_config):
                                 className="text-muted me-1 mb-2"
                             ),
                             html.Span(
-                                playbook_config.name,
+                                name,
                                 className="mb-2 halberd-brand text-xl"
                             ),
                             # Metadata row
@@ -254,7 +288,7 @@ def create_playbook_item(playbook_config):
                                         className="me-1 mb-2 text-muted"
                                     ),
                                     html.Span(
-                                        playbook_config.author,
+                                        author,
                                         className="text-muted halberd-text me-3"
                                     ),
                                 ]),
@@ -265,7 +299,7 @@ def create_playbook_item(playbook_config):
                                         className="me-1 mb-2 text-muted"
                                     ),
                                     html.Span(
-                                        playbook_config.creation_date,
+                                        creation_date,
                                         className="text-muted halberd-text"
                                     ),
                                 ]),
@@ -275,17 +309,10 @@ def create_playbook_item(playbook_config):
                         # Description div with fixed height
                         html.Div(
                             html.P(
-                                playbook_config.description[:100] + "..." 
-                                if len(playbook_config.description) > 100 
-                                else playbook_config.description,
+                                short_description,
                                 className="mb-0 text-muted lh-base halberd-typography"
                             ),
-                            style={
-                                "minHeight": "45px",
-                                "maxHeight": "45px",
-                                "overflow": "hidden",
-                                "textOverflow": "ellipsis"
-                            }
+                            style=PLAYBOOK_DESCRIPTION_STYLE
                         )
                     ], width=9),
 
@@ -302,7 +329,7 @@ def create_playbook_item(playbook_config):
                                     ),
                                     "Execute"
                                 ],
-                                id={"type": "execute-playbook-button", "index": playbook_config.yaml_file},
+                                id={"type": "execute-playbook-button", "index": yaml_file},
                                 size="sm",
                                 className="w-100 mb-2 halberd-button"
                             ),
@@ -310,7 +337,7 @@ def create_playbook_item(playbook_config):
                             dbc.ButtonGroup([
                                 dbc.Button(
                                     DashIconify(icon="mdi:pencil", width=16),
-                                    id={"type": "edit-playbook-button", "index": playbook_config.yaml_file},
+                                    id={"type": "edit-playbook-button", "index": yaml_file},
                                     color="light",
                                     size="sm",
                                     title="Edit",
@@ -318,7 +345,7 @@ def create_playbook_item(playbook_config):
                                 ),
                                 dbc.Button(
                                     DashIconify(icon="mdi:calendar", width=16),
-                                    id={"type": "open-schedule-win-playbook-button", "index": playbook_config.yaml_file},
+                                    id={"type": "open-schedule-win-playbook-button", "index": yaml_file},
                                     color="light",
                                     size="sm",
                                     title="Schedule",
@@ -326,7 +353,7 @@ def create_playbook_item(playbook_config):
                                 ),
                                 dbc.Button(
                                     DashIconify(icon="mdi:download", width=16),
-                                    id={"type": "open-export-win-playbook-button", "index": playbook_config.yaml_file},
+                                    id={"type": "open-export-win-playbook-button", "index": yaml_file},
                                     color="light",
                                     size="sm",
                                     title="Export",
@@ -334,7 +361,7 @@ def create_playbook_item(playbook_config):
                                 ),
                                 dbc.Button(
                                     DashIconify(icon="mdi:delete", width=16),
-                                    id={"type": "delete-playbook-button", "index": playbook_config.yaml_file},
+                                    id={"type": "delete-playbook-button", "index": yaml_file},
                                     color="light",
                                     size="sm",
                                     title="Delete",
@@ -344,7 +371,7 @@ def create_playbook_item(playbook_config):
                         ], 
                         className="mx-3 d-flex flex-column halberd-text",
                         # Add zindex to prevent click propagation on buttons
-                        style={"zIndex": "1"}),
+                        style=PLAYBOOK_ACTIONS_STYLE),
                     ], 
                     width=3,
                     className="d-flex align-items-center"
@@ -353,19 +380,14 @@ def create_playbook_item(playbook_config):
             ], className="p-3"),
         ],
         className="mb-3 halberd-depth-card",
-        style={
-            "backgroundColor": "#2d2d2d",
-        }
+        style=PLAYBOOK_CARD_STYLE
         ),
     ],
     # Click handler div
-    id={"type": "playbook-card-click", "index": playbook_config.yaml_file},
+    id={"type": "playbook-card-click", "index": yaml_file},
     className="cursor-pointer hover-highlight",
     # CSS to handle hover and click states
-    style={
-        "position": "relative",
-        "cursor": "pointer",
-    }
+    style=PLAYBOOK_CARD_CLICK_STYLE
     )
 
 # Static div for export playbook workflow
@@ -613,6 +635,14 @@ def generate_playbook_creator_offcanvas():
                 ])
             ]
 
+# Techniques are only instantiated to read their names once, not for every step form
+@lru_cache(maxsize=1)
+def _module_dropdown_options():
+    return [
+        {"label": technique().name, "value": tid}
+        for tid, technique in TechniqueRegistry.list_techniques().items()
+    ]
+
 def generate_step_form(step_number):
     """Generate form elements for a single playbook step"""
     return dbc.Card([
@@ -636,10 +666,7 @@ def generate_step_form(step_number):
                     dbc.Label("Module *"),
                     dcc.Dropdown(
                         id={"type": "step-module-dropdown", "index": step_number},
-                        options=[
-                            {"label": technique().name, "value": tid}
-                            for tid, technique in TechniqueRegistry.list_techniques().items()
-                        ],
+                        options=_module_dropdown_options(),
                         placeholder="Select module",
                         className="bg-halberd-dark halberd-text halberd-dropdown"
                     )
@@ -750,6 +777,14 @@ def generate_playbook_editor_offcanvas():
         backdropClassName="halberd-offcanvas-backdrop"
         )
 
+# Technique parameter configs are static, so each technique is only instantiated once to read them
+@lru_cache(maxsize=None)
+def _technique_parameters(module_id):
+    return TechniqueRegistry.get_technique(module_id)().get_parameters()
+
+# Displayed in place of parameter inputs for techniques without parameters
+NO_CONFIG_REQUIRED_MESSAGE = html.P("No config required", className="halberd-text")
+
 def playbook_editor_create_parameter_inputs(module_id, existing_params=None):
     """Helper function to create parameter input elements"""
     if not module_id:
@@ -758,11 +793,10 @@ def playbook_editor_create_parameter_inputs(module_id, existing_params=None):
     # Initialize existing_params to empty dict if None
     existing_params = existing_params or {}
     
-    technique = TechniqueRegistry.get_technique(module_id)()
-    params = technique.get_parameters()
+    params = _technique_parameters(module_id)
     
     if not params:
-        return html.P("No config required", className="halberd-text")
+        return NO_CONFIG_REQUIRED_MESSAGE
     
     param_inputs = []
     for param_name, param_config in params.items():
@@ -815,13 +849,8 @@ def create_execution_progress_offcanvas():
             id="playbook-execution-progress",
             className="mb-4"
         ),
-        
-        # Interval for updates
-        dcc.Interval(
-            id="execution-interval",
-            interval=1000,
-            disabled=True
-        ),
+        # Execution and step results last rendered in the progress content
+        dcc.Store(id="playbook-execution-progress-key"),
     ],
     id="execution-progress-offcanvas",
     title=html.H3("Execution Progress"),
@@ -833,37 +862,26 @@ def create_execution_progress_offcanvas():
     scrollable=True
     )
 
+# Step progress (icon, icon class, status text class) for the running step, completed steps and pending steps
+STEP_ACTIVE_STYLE = ("mdi:progress-clock", "text-primary animate-spin", "text-light")
+STEP_STATUS_STYLES = {
+    "success": ("mdi:check-circle", "text-success", "text-success"),
+    "failed": ("mdi:alert-circle", "text-danger", "text-danger"),
+}
+STEP_PENDING_STYLE = ("mdi:circle-outline", "text-gray-400", "text-muted")
+
 def create_step_progress_card(step_number, module_name, status=None, is_active=False, message=None):
     """Creates a card showing execution status for a single playbook step"""
     # Define status icon and color
     if is_active:
-        icon = DashIconify(
-            icon="mdi:progress-clock",
-            width=24,
-            className="text-primary animate-spin"
-        )
-        status_color = "text-light"
-    elif status == "success":
-        icon = DashIconify(
-            icon="mdi:check-circle",
-            width=24,
-            className="text-success"
-        )
-        status_color = "text-success"
-    elif status == "failed":
-        icon = DashIconify(
-            icon="mdi:alert-circle",
-            width=24,
-            className="text-danger"
-        )
-        status_color = "text-danger"
+        icon_name, icon_class, status_color = STEP_ACTIVE_STYLE
     else:
-        icon = DashIconify(
-            icon="mdi:circle-outline",
-            width=24,
-            className="text-gray-400"
-        )
-        status_color = "text-muted"
+        icon_name, icon_class, status_color = STEP_STATUS_STYLES.get(status, STEP_PENDING_STYLE)
+    icon = DashIconify(
+        icon=icon_name,
+        width=24,
+        className=icon_class
+    )
 
     return dbc.Card([
         dbc.CardBody([
@@ -896,29 +914,113 @@ def create_step_progress_card(step_number, module_name, status=None, is_active=F
         ])
     ], className=f"mb-2 {'border-primary' if is_active else ''} bg-halberd-dark")
 
-# Create Automator layout
-layout = create_playbook_manager_layout
+def create_empty_playbook_list():
+    """Creates the message displayed when no playbooks are found on system"""
+    return html.Div(
+        children=[
+            html.Div([
+                DashIconify(
+                    icon="mdi:information-outline", #Information icon
+                    width=48,
+                    height=48,
+                    className="text-muted mb-3"
+                ),
+                html.P(
+                    "Create or Import a playbook", # Default message when no playbook is selected
+                    className="halberd-text text-muted")
+            ], className="text-center")
+        ],
+        className="d-flex justify-content-center align-items-center",
+        style={'padding':'20px'}
+    )
+
+# Search index of lowercase playbook names, refreshed when a playbook file changes
+@lru_cache(maxsize=1024)
+def _playbook_search_name(pb_file, mtime_ns):
+    return Playbook(pb_file).name.lower()
+
+def _playbook_matches_search(pb_file, query):
+    """Checks a lowercase search query against the indexed playbook name"""
+    try:
+        mtime_ns = os.stat(os.path.join(AUTOMATOR_PLAYBOOKS_DIR, pb_file)).st_mtime_ns
+        return query in _playbook_search_name(pb_file, mtime_ns)
+    except Exception as e:
+        print(f"Error loading playbook {pb_file}: {str(e)}")
+        return False
+
+def create_playbook_list(playbooks, search_query=None, limit=PLAYBOOK_LIST_PAGE_SIZE):
+    """Creates the playbook cards for the first page(s) of the playbook list. Playbooks past the limit are not loaded"""
+    if not playbooks:
+        return create_empty_playbook_list()
+
+    # Apply search filter if query exists
+    if search_query:
+        query = search_query.lower()
+        playbooks = [pb_file for pb_file in playbooks if _playbook_matches_search(pb_file, query)]
+
+    # Initialize list to store playbook items
+    playbook_items = []
+    has_more = False
+
+    for pb_file in playbooks:
+        if len(playbook_items) >= limit:
+            # Remaining playbooks are only rendered once requested
+            has_more = True
+            break
+        try:
+            pb_config = Playbook(pb_file)
+            playbook_items.append(create_playbook_item(pb_config))
+        except Exception as e:
+            print(f"Error loading playbook {pb_file}: {str(e)}")
+
+    if has_more:
+        # Button to render the next page of playbooks
+        playbook_items.append(
+            dbc.Button(
+                "Show More",
+                id="playbook-list-more-button",
+                n_clicks=0,
+                className="w-100 mb-3 halberd-button-secondary"
+            )
+        )
+
+    return playbook_items
+
+# Create Automator layout. It has no per visit content (playbook list is filled by callback), so it is built once
+layout = create_playbook_manager_layout()
 
 # Callbacks
 '''Callback to generate attack sequence visualization in Automator'''
 @callback(
     Output("playbook-visualization-container", "children"),
+    Output("playbook-visualization-key", "data"),
     [Input({"type": "playbook-card-click", "index": ALL}, "n_clicks")],
+    State("playbook-visualization-key", "data"),
     prevent_initial_call=True
 )
-def update_visualization(n_clicks):
+def update_visualization(n_clicks, visualization_key):
     """Update the visualization when a playbook is selected"""
     if not callback_context.triggered:
         raise PreventUpdate
     
     # Get the triggered component's ID
     triggered = callback_context.triggered[0]
-    prop_id = json.loads(triggered['prop_id'].rsplit('.',1)[0])
     
     if triggered['value'] is None:  # No clicks yet
         raise PreventUpdate
         
-    playbook_id = prop_id['index']
+    triggered_id = callback_context.triggered_id
+    if triggered_id is None:
+        raise PreventUpdate
+    playbook_id = triggered_id['index']
+
+    # Card action buttons also click the card, so skip re-rendering a displayed playbook that is unchanged
+    try:
+        new_visualization_key = [playbook_id, os.stat(os.path.join(AUTOMATOR_PLAYBOOKS_DIR, playbook_id)).st_mtime_ns]
+    except OSError:
+        new_visualization_key = None
+    if new_visualization_key is not None and new_visualization_key == visualization_key:
+        raise PreventUpdate
     
     try:
         pb_config = Playbook(playbook_id)
@@ -947,13 +1049,13 @@ def update_visualization(n_clicks):
                     )
                 ])
             ], className="bg-halberd-dark halberd-depth-card"),
-            html.Div(playbook_viz_generator(pb_config.name), className="mb-3"),
-        ])
+            html.Div(playbook_viz_generator(pb_config.name, pb_config.yaml_file), className="mb-3"),
+        ]), new_visualization_key
     except Exception as e:
         return html.Div([
             html.H4("Error Loading Visualization", className="text-danger"),
             html.P(str(e), className="text-muted")
-        ], className="p-3")
+        ], className="p-3"), None
 
 '''Callback to execute attack sequence in automator view'''
 @callback(
@@ -977,8 +1079,7 @@ def execute_playbook_callback(n_clicks):
         raise PreventUpdate
         
     # Get clicked playbook
-    button_id = ctx.triggered[0]['prop_id'].rsplit('.',1)[0]
-    playbook_file = eval(button_id)['index']
+    playbook_file = ctx.triggered_id['index']
     
     try:
         # Execute playbook in background thread
@@ -1018,8 +1119,7 @@ def toggle_pb_schedule_canvas_callback(n_clicks):
         raise PreventUpdate
     
     # Extract playbook name from context
-    button_id = ctx.triggered[0]['prop_id'].rsplit('.',1)[0]
-    selected_pb_name = eval(button_id)['index']
+    selected_pb_name = ctx.triggered_id['index']
 
     return True, html.H3(["Schedule Playbook"]), schedule_pb_div, selected_pb_name
 
@@ -1090,8 +1190,9 @@ def export_playbook_callback(selected_pb_data, mask_param, export_file_name, n_c
         Output("playbook-stats", "children", allow_duplicate=True),
         Input(component_id = 'import-pb-button', component_property = 'n_clicks'), 
         Input(component_id = 'upload-playbook', component_property = 'contents'), 
+        State(component_id = 'playbook-list-limit', component_property = 'data'),
         prevent_initial_call=True)
-def import_playbook_callback(n_clicks, file_contents):
+def import_playbook_callback(n_clicks, file_contents, limit):
     if n_clicks == 0:
         raise PreventUpdate
 
@@ -1101,16 +1202,7 @@ def import_playbook_callback(n_clicks, file_contents):
             Playbook.import_playbook(file_contents)
 
             # Refresh the playbook list
-            playbooks = GetAllPlaybooks()
-            playbook_items = []
-            
-            for pb_file in playbooks:
-                try:
-                    pb_config = Playbook(pb_file)
-                    # Apply search filter if query exists
-                    playbook_items.append(create_playbook_item(pb_config))
-                except Exception as e:
-                    print(f"Error loading playbook {pb_file}: {str(e)}")
+            playbook_items = create_playbook_list(GetAllPlaybooks(), limit=limit)
             
             # Generate stats
             stats = get_playbook_stats()
@@ -1217,8 +1309,9 @@ def toggle_add_to_pb_modal_callback(n1, n2, n3, is_open):
     Output("playbook-list-container", "children"),
     Output("playbook-stats", "children"),
     Input("playbook-search", "value"),
+    Input("playbook-list-limit", "data"),
 )
-def update_playbook_list_callback(search_query):
+def update_playbook_list_callback(search_query, limit):
     """Update the playbook list and stats based on search query"""
     # Get all available playbooks on system
     playbooks = GetAllPlaybooks()
@@ -1227,50 +1320,29 @@ def update_playbook_list_callback(search_query):
     stats = get_playbook_stats()
     stats_text = (f"{stats['total_playbooks']} playbooks loaded • "f"Last sync: {stats['last_sync'].strftime('%I:%M %p') if stats['last_sync'] else 'never'}")
     
-    # If no playbooks found on system
-    if not playbooks:
-        empty_playbook_list_div = html.Div(
-            children=[
-                html.Div([
-                    DashIconify(
-                        icon="mdi:information-outline", #Information icon
-                        width=48,
-                        height=48,
-                        className="text-muted mb-3"
-                    ),
-                    html.P(
-                        "Create or Import a playbook", # Default message when no playbook is selected
-                        className="halberd-text text-muted")
-                ], className="text-center")
-            ],
-            className="d-flex justify-content-center align-items-center",
-            style={'padding':'20px'}
-        )
-        return empty_playbook_list_div, stats_text
-    
-    # Initialize list to store playbook items
-    playbook_items = []
-    
-    for pb_file in playbooks:
-        try:
-            pb_config = Playbook(pb_file)
-            # Apply search filter if query exists
-            if search_query and search_query.lower() not in pb_config.name.lower():
-                continue
-            playbook_items.append(create_playbook_item(pb_config))
-        except Exception as e:
-            print(f"Error loading playbook {pb_file}: {str(e)}")
+    return create_playbook_list(playbooks, search_query, limit), stats_text
 
-    return playbook_items, stats_text
+'''[Automator] Callback to render the next page of the playbook list'''
+@callback(
+    Output("playbook-list-limit", "data"),
+    Input("playbook-list-more-button", "n_clicks"),
+    State("playbook-list-limit", "data"),
+    prevent_initial_call=True
+)
+def show_more_playbooks_callback(n_clicks, limit):
+    if not n_clicks:
+        raise PreventUpdate
+    return limit + PLAYBOOK_LIST_PAGE_SIZE
     
 '''Callback to delete playbook from automator'''
 @callback(
     Output('playbook-list-container', 'children', allow_duplicate=True),
     Output("playbook-stats", "children", allow_duplicate=True),
     Input({'type': 'delete-playbook-button', 'index': ALL}, 'n_clicks'),
+    State('playbook-list-limit', 'data'),
     prevent_initial_call=True
 )
-def delete_playbook(n_clicks):
+def delete_playbook(n_clicks, limit):
     """Handles playbook deletion"""
     if not any(n_clicks):
         return no_update
@@ -1280,8 +1352,7 @@ def delete_playbook(n_clicks):
     if not ctx.triggered:
         return no_update
     
-    button_id = ctx.triggered[0]['prop_id'].rsplit('.',1)[0]
-    playbook_file = eval(button_id)['index']
+    playbook_file = ctx.triggered_id['index']
 
     try:
         # Delete the playbook file
@@ -1294,39 +1365,7 @@ def delete_playbook(n_clicks):
         stats = get_playbook_stats()
         stats_text = (f"{stats['total_playbooks']} playbooks loaded • "f"Last sync: {stats['last_sync'].strftime('%I:%M %p') if stats['last_sync'] else 'never'}")
 
-        if not playbooks:
-            empty_playbook_list_div = html.Div(
-                children=[
-                    html.Div([
-                        DashIconify(
-                            icon="mdi:information-outline", #Information icon
-                            width=48,
-                            height=48,
-                            className="text-muted mb-3"
-                        ),
-                        html.P("Create or Import a playbook", # Default message when no playbook is selected
-                                className="text-muted")
-                    ], className="text-center")
-                ],
-                className="d-flex justify-content-center align-items-center",
-                style={'padding':'20px'}
-            )
-            return empty_playbook_list_div, stats_text
-
-        # Initialize list to store playbook items
-        playbook_items = []
-        
-        for pb_file in playbooks:
-            try:
-                pb_config = Playbook(pb_file)
-                # Apply search filter if query exists
-                playbook_items.append(create_playbook_item(pb_config))
-            except Exception as e:
-                print(f"Error loading playbook {pb_file}: {str(e)}")
-        
-        
-        
-        return playbook_items, stats_text
+        return create_playbook_list(playbooks, limit=limit), stats_text
     except Exception as e:
         print(f"Error deleting playbook {playbook_file}: {str(e)}")
         return no_update
@@ -1362,8 +1401,7 @@ def toggle_pb_export_canvas_callback(n_clicks):
         raise PreventUpdate
     
     # Extract playbook name from context
-    button_id = ctx.triggered[0]['prop_id'].rsplit('.',1)[0]
-    selected_pb_name = eval(button_id)['index']
+    selected_pb_name = ctx.triggered_id['index']
     
     return True, [html.H3("Export Playbook")], export_pb_div, selected_pb_name
 
@@ -1379,8 +1417,7 @@ def update_step_parameters(module_id):
     if not module_id:
         return []
     
-    technique = TechniqueRegistry.get_technique(module_id)()
-    params = technique.get_parameters()
+    params = _technique_parameters(module_id)
     
     if not params:
         return html.P("No parameters required", className="text-muted")
@@ -1442,15 +1479,18 @@ def update_step_parameters(module_id):
 @callback(
     Output("playbook-steps-container", "children"),
     Input("add-playbook-step-button", "n_clicks"),
-    State("playbook-steps-container", "children"),
+    State({"type": "step-module-dropdown", "index": ALL}, "id"),
     prevent_initial_call=True
 )
-def add_playbook_step(n_clicks, current_steps):
+def add_playbook_step(n_clicks, step_ids):
     """Add a new step form to the playbook creator"""
     if n_clicks:
-        new_step_number = len(current_steps) + 1
-        return current_steps + [generate_step_form(new_step_number)]
-    return current_steps
+        # Append the new step without sending the existing steps back and forth
+        new_step_number = len(step_ids) + 1
+        steps = Patch()
+        steps.append(generate_step_form(new_step_number))
+        return steps
+    raise PreventUpdate
 
 '''[Playbook Creator] Callback to remove a step from playbook'''
 @callback(
@@ -1469,8 +1509,7 @@ def remove_playbook_step(n_clicks, current_steps):
     if not ctx.triggered:
         raise PreventUpdate
     
-    button_id = json.loads(ctx.triggered[0]["prop_id"].rsplit(".")[0])
-    step_to_remove = button_id["index"]
+    step_to_remove = ctx.triggered_id["index"]
 
     # Remove the step and renumber remaining steps
     remaining_steps = [step for step in current_steps if int(step["props"]["children"][0]["props"]["children"][0]["props"]["children"][0]["props"]["children"][0]["props"]["children"].split()[-1]) != step_to_remove]
@@ -1526,8 +1565,7 @@ def create_playbook_from_offcanvas(n_clicks, name, desc, author, refs, modules,
         for i, module in enumerate(modules):
             if module:  # If module is selected
                 # Get technique parameters configuration
-                technique = TechniqueRegistry.get_technique(module)()
-                technique_params = technique.get_parameters()
+                technique_params = _technique_parameters(module)
                 
                 # Initialize params dict for this step
                 step_params[i] = {}
@@ -1589,8 +1627,7 @@ def update_editable_playbook_view(n_clicks):
         raise PreventUpdate
     
     # Extract playbook file name from context
-    button_id = ctx.triggered[0]['prop_id'].rsplit('.',1)[0]
-    selected_pb = eval(button_id)['index']
+    selected_pb = ctx.triggered_id['index']
 
     return True, selected_pb
 
@@ -1617,8 +1654,7 @@ def load_playbook_data(n_clicks):
         raise PreventUpdate
     
     # Extract playbook file name from context
-    button_id = ctx.triggered[0]['prop_id'].rsplit('.',1)[0]
-    selected_pb = eval(button_id)['index']
+    selected_pb = ctx.triggered_id['index']
     
     # Find the selected playbook
     try:
@@ -1650,10 +1686,7 @@ def load_playbook_data(n_clicks):
                             dbc.Label("Module *"),
                             dcc.Dropdown(
                                 id={"type": "step-module-dropdown-editor", "index": step_no},
-                                options=[
-                                    {"label": technique().name, "value": tid}
-                                    for tid, technique in TechniqueRegistry.list_techniques().items()
-                                ],
+                                options=_module_dropdown_options(),
                                 value=step_data.get('Module'),
                                 placeholder="Select module",
                                 className="bg-halberd-dark halberd-dropdown halberd-text"
@@ -1703,13 +1736,13 @@ def load_playbook_data(n_clicks):
 @callback(
     Output("playbook-steps-editor-container", "children", allow_duplicate=True),
     Input("add-playbook-step-editor-button", "n_clicks"),
-    State("playbook-steps-editor-container", "children"),
+    State({"type": "step-module-dropdown-editor", "index": ALL}, "id"),
     prevent_initial_call=True
 )
-def add_playbook_step_editor(n_clicks, current_steps):
+def add_playbook_step_editor(n_clicks, step_ids):
     """Add a new step form to the playbook editor"""
     if n_clicks:
-        new_step_number = len(current_steps) + 1
+        new_step_number = len(step_ids) + 1
         new_step = dbc.Card([
             dbc.CardBody([
                 # Step header
@@ -1733,10 +1766,7 @@ def add_playbook_step_editor(n_clicks, current_steps):
                         dbc.Label("Module *"),
                         dcc.Dropdown(
                             id={"type": "step-module-dropdown-editor", "index": new_step_number},
-                            options=[
-                                {"label": technique().name, "value": tid}
-                                for tid, technique in TechniqueRegistry.list_techniques().items()
-                            ],
+                            options=_module_dropdown_options(),
                             placeholder="Select module",
                             className="bg-halberd-dark halberd-dropdown halberd-text"
                         )
@@ -1765,8 +1795,11 @@ def add_playbook_step_editor(n_clicks, current_steps):
             ])
         ], className="mb-3 halberd-depth-card")
         
-        return current_steps + [new_step]
-    return current_steps
+        # Append the new step without sending the existing steps back and forth
+        steps = Patch()
+        steps.append(new_step)
+        return steps
+    raise PreventUpdate
 
 '''[Playbook Editor] Callback to update parameters on technique change from dropdown'''
 @callback(
@@ -1822,8 +1855,7 @@ def update_playbook_from_editor(n_clicks, name, desc, author, refs, modules, wai
         step_params = {}
         for i, module in enumerate(modules):
             if module:
-                technique = TechniqueRegistry.get_technique(module)()
-                technique_params = technique.get_parameters()
+                technique_params = _technique_parameters(module)
                 step_params[i] = {}
                 
                 for param_id, param_value in zip(param_ids, param_values):
@@ -1867,8 +1899,7 @@ def remove_playbook_step_editor(n_clicks, current_steps):
         raise PreventUpdate
     
     try:
-        button_id = json.loads(ctx.triggered[0]["prop_id"].split(".")[0])
-        step_to_remove = button_id["index"]
+        step_to_remove = ctx.triggered_id["index"]
         
         # Create new list without the removed step
         remaining_steps = []
@@ -1912,11 +1943,15 @@ def remove_playbook_step_editor(n_clicks, current_steps):
 @callback(
     Output("playbook-execution-progress", "children"),
     Output("execution-interval", "disabled"),
+    Output("playbook-execution-progress-key", "data"),
+    Output("execution-interval", "interval"),
     Input("execution-interval", "n_intervals"),
     State("selected-playbook-data", "data"),
+    State("playbook-execution-progress-key", "data"),
+    State("execution-interval", "interval"),
     prevent_initial_call=True
 )
-def update_execution_progress(n_intervals, playbook_data):
+def update_execution_progress(n_intervals, playbook_data, progress_key, poll_interval):
     """Update the execution progress display"""
     if not playbook_data:
         raise PreventUpdate
@@ -1941,6 +1976,17 @@ def update_execution_progress(n_intervals, playbook_data):
         # Get execution results
         results = parse_execution_report(execution_folder)
         active_step = len(results)
+
+        # Check if execution is complete
+        is_complete = active_step == total_steps
+
+        # Skip re-rendering when no step has completed since the last update
+        new_progress_key = [latest_folder, [result.get('status') for result in results]]
+        if new_progress_key == progress_key:
+            if is_complete or poll_interval >= EXECUTION_POLL_MAX_INTERVAL:
+                return no_update, is_complete, no_update, no_update
+            # Poll less often while the current step is still running
+            return no_update, False, no_update, min(poll_interval * 2, EXECUTION_POLL_MAX_INTERVAL)
         
         # Create status cards for each step
         step_cards = []
@@ -1988,10 +2034,7 @@ def update_execution_progress(n_intervals, playbook_data):
             dbc.CardBody(step_cards)
         ], className="bg-halberd-dark text-light mb-4")
         
-        # Check if execution is complete
-        is_complete = active_step == total_steps
-        
-        return progress_tracker, is_complete
+        return progress_tracker, is_complete, new_progress_key, EXECUTION_POLL_INTERVAL
         
     except Exception as e:
         print(f"Error updating progress: {str(e)}")
@@ -2017,10 +2060,10 @@ def manage_progress_display(execute_clicks, view_clicks, is_open):
     if not ctx.triggered:
         raise PreventUpdate
         
-    trigger_id = ctx.triggered[0]['prop_id'].split('.')[0]
+    trigger_id = ctx.triggered_id
     
     # Handle execute button clicks
-    if "execute-playbook-button" in trigger_id:
+    if isinstance(trigger_id, dict) and trigger_id.get("type") == "execute-playbook-button":
         if any(click for click in execute_clicks if click):
             # Show button and open offcanvas
             return True, {"display": "block"}, False